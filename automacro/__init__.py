@@ -1,25 +1,29 @@
-from automacro.core import ThreadPool
-from automacro.workflow import (
-    Breakpoint,
-    ExecutionContext,
-    If,
-    IfAndElse,
-    InterruptException,
-    Node,
-    NodeChain,
-    NodeLike,
-    Sleep,
-    Task,
-    TaskCallable,
-    Wait,
-    While,
-    Workflow,
-    WorkflowState,
-    bp,
-    coerce_to_node,
-    if_,
-    while_,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from automacro.core import ThreadPool
+    from automacro.workflow import (
+        Breakpoint,
+        ExecutionContext,
+        If,
+        IfAndElse,
+        InterruptException,
+        Node,
+        NodeChain,
+        NodeLike,
+        Sleep,
+        Task,
+        TaskCallable,
+        Wait,
+        While,
+        Workflow,
+        WorkflowState,
+        bp,
+        coerce_to_node,
+        if_,
+        while_,
+    )
 
 __all__ = [
     "ThreadPool",
@@ -43,3 +47,34 @@ __all__ = [
     "if_",
     "while_",
 ]
+
+# Public names are imported from their subpackage on first access (PEP 562),
+# so that importing `automacro` only pays for the parts that are actually used
+_LAZY_IMPORTS = {
+    name: "automacro.core" if name == "ThreadPool" else "automacro.workflow"
+    for name in __all__
+}
+
+# Subpackages that used to be bound as attributes by the eager imports above,
+# kept resolvable so that `import automacro; automacro.workflow` still works
+_LAZY_SUBPACKAGES = frozenset({"core", "workflow"})
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBPACKAGES:
+        # Importing a submodule also binds it as an attribute of this package
+        return importlib.import_module(f"{__name__}.{name}")
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+
+    # Cache the value so that __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBPACKAGES)
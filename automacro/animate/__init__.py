@@ -1,5 +1,5 @@
 from . import easing
 
-from .interpolate import interpolate, interpolate_sequence
+from .interpolate import interpolate, interpolate_batch, interpolate_sequence
 
-__all__ = ["easing", "interpolate", "interpolate_sequence"]
+__all__ = ["easing", "interpolate", "interpolate_batch", "interpolate_sequence"]
@@ -1,5 +1,11 @@
 import math
 
+_PI = math.pi
+_HALF_PI = math.pi / 2
+
+# 2^(10x) == e^(10 * ln(2) * x), which avoids the generic pow() path
+_LN2_10 = 10 * math.log(2)
+
 
 def linear(t: float) -> float:
     return t
@@ -72,23 +78,23 @@ def ease_in_out_quint(t: float) -> float:
 
 
 def ease_in_sine(t: float) -> float:
-    return 1 - math.cos((t * math.pi) / 2)
+    return 1 - math.cos(t * _HALF_PI)
 
 
 def ease_out_sine(t: float) -> float:
-    return math.sin((t * math.pi) / 2)
+    return math.sin(t * _HALF_PI)
 
 
 def ease_in_out_sine(t: float) -> float:
-    return -(math.cos(math.pi * t) - 1) / 2
+    return -(math.cos(_PI * t) - 1) / 2
 
 
 def ease_in_expo(t: float) -> float:
-    return 0 if t == 0 else math.pow(2, 10 * (t - 1))
+    return 0 if t == 0 else math.exp(_LN2_10 * (t - 1))
 
 
 def ease_out_expo(t: float) -> float:
-    return 1 if t == 1 else 1 - math.pow(2, -10 * t)
+    return 1 if t == 1 else 1 - math.exp(-_LN2_10 * t)
 
 
 def ease_in_out_expo(t: float) -> float:
@@ -97,9 +103,9 @@ def ease_in_out_expo(t: float) -> float:
     if t == 1:
         return 1
     if t < 0.5:
-        return math.pow(2, 20 * t - 10) / 2
+        return math.exp(_LN2_10 * (2 * t - 1)) / 2
     else:
-        return (2 - math.pow(2, -20 * t + 10)) / 2
+        return (2 - math.exp(_LN2_10 * (1 - 2 * t))) / 2
 
 
 def ease_in_circ(t: float) -> float:
@@ -55,4 +55,45 @@ def interpolate_sequence(
         list[float]: The interpolated sequence of values.
     """
 
-    return [interpolate(s, e, t, duration, easing_fn) for s, e in zip(start, end)]
+    if duration <= 0:
+        return [e for _, e in zip(start, end)]
+
+    # The eased progress is the same for every element, so compute it once
+    # instead of once per element
+    progress = easing_fn(max(0.0, min(t / duration, 1.0)))
+
+    return [s + (e - s) * progress for s, e in zip(start, end)]
+
+
+def interpolate_batch(
+    start: float,
+    end: float,
+    ts: Iterable[float],
+    duration: float,
+    easing_fn: Callable[[float], float],
+) -> list[float]:
+    """
+    Interpolate between start and end values at multiple points in time.
+
+    This is equivalent to calling `interpolate` once for each time in `ts`,
+    but avoids repeating the per-call setup, which makes it better suited for
+    precomputing the frames of an animation.
+
+    Args:
+        start (float): The starting value.
+        end (float): The ending value.
+        ts (Iterable[float]): The times (in seconds) elapsed to interpolate
+        at. Times outside of [0, duration] are clamped to that range.
+        duration (float): The total duration of the interpolation (in seconds).
+        easing_fn (Callable[[float], float]): Easing function to apply.
+
+    Returns:
+        list[float]: The interpolated value for each time in `ts`.
+    """
+
+    if duration <= 0:
+        return [end for _ in ts]
+
+    delta = end - start
+
+    return [start + delta * easing_fn(max(0.0, min(t / duration, 1.0))) for t in ts]
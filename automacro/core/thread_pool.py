@@ -1,3 +1,4 @@
+import itertools
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor
 
@@ -7,16 +8,37 @@ class ThreadPool:
     A simple thread pool for executing tasks concurrently.
     """
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, shards: int = 1):
         """
         Initialize a thread pool.
 
         Args:
             max_workers (int): The maximum number of worker threads.
             Default is 4.
+            shards (int): The number of independent work queues to split the
+            workers across. Tasks are distributed round-robin across the
+            shards, which reduces contention when many threads submit tasks
+            concurrently. It is capped at max_workers. Note that with more
+            than one shard, tasks are no longer guaranteed to start in
+            submission order. Default is 1.
         """
 
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        if shards < 1:
+            raise ValueError(f"ThreadPool: shards must be at least 1, got {shards}")
+
+        # Every shard needs at least one worker, so there are never more
+        # shards than workers
+        shards = min(shards, max(1, max_workers))
+
+        # Spread the workers as evenly as possible, so that the shards add up
+        # to exactly max_workers
+        base, remainder = divmod(max_workers, shards)
+
+        self._executors = tuple(
+            ThreadPoolExecutor(max_workers=base + (i < remainder))
+            for i in range(shards)
+        )
+        self._counter = itertools.count()
         self._lock = threading.Lock()
 
     def __enter__(self):
@@ -35,10 +57,24 @@ class ThreadPool:
 
         Returns:
             Future: A Future object representing the execution of the task.
+
+        Raises:
+            RuntimeError: If the thread pool has been shut down.
         """
 
-        with self._lock:
-            return self._executor.submit(fn, *args, **kwargs)
+        executors = self._executors
+
+        if len(executors) == 1:
+            executor = executors[0]
+        else:
+            # next() on itertools.count is atomic, so concurrent submitters
+            # never need to coordinate to pick a shard
+            executor = executors[next(self._counter) % len(executors)]
+
+        # ThreadPoolExecutor.submit is already thread-safe, and raises a
+        # RuntimeError if the executor has been shut down, so no additional
+        # locking is needed here
+        return executor.submit(fn, *args, **kwargs)
 
     def shutdown(self, wait: bool = True):
         """
@@ -50,4 +86,5 @@ class ThreadPool:
         """
 
         with self._lock:
-            self._executor.shutdown(wait=wait)
+            for executor in self._executors:
+                executor.shutdown(wait=wait)
@@ -1,30 +1,34 @@
-from bidict import bidict
+# Maps shifted characters to their unshifted equivalents
+_UNSHIFT_MAP = {
+    "~": "`",
+    "!": "1",
+    "@": "2",
+    "#": "3",
+    "$": "4",
+    "%": "5",
+    "^": "6",
+    "&": "7",
+    "*": "8",
+    "(": "9",
+    ")": "0",
+    "_": "-",
+    "+": "=",
+    "{": "[",
+    "}": "]",
+    "|": "\\",
+    ":": ";",
+    '"': "'",
+    "<": ",",
+    ">": ".",
+    "?": "/",
+}
 
-_SHIFT_MAP = bidict(
-    {
-        "~": "`",
-        "!": "1",
-        "@": "2",
-        "#": "3",
-        "$": "4",
-        "%": "5",
-        "^": "6",
-        "&": "7",
-        "*": "8",
-        "(": "9",
-        ")": "0",
-        "_": "-",
-        "+": "=",
-        "{": "[",
-        "}": "]",
-        "|": "\\",
-        ":": ";",
-        '"': "'",
-        "<": ",",
-        ">": ".",
-        "?": "/",
-    }
-)
+# Maps unshifted characters to their shifted equivalents
+_SHIFT_MAP = {v: k for k, v in _UNSHIFT_MAP.items()}
+
+# Unshifted equivalent of every ASCII character, so that the common case in
+# unshift_char is a single lookup with no case conversion
+_UNSHIFT_ASCII = {c: _UNSHIFT_MAP.get(c, c.lower()) for c in map(chr, range(128))}
 
 
 def unshift_char(char: str) -> str:
@@ -44,7 +48,10 @@ def unshift_char(char: str) -> str:
             f"unshift_char: input must be a single character, got '{char}'"
         )
 
-    return _SHIFT_MAP.get(char, char.lower())
+    unshifted = _UNSHIFT_ASCII.get(char)
+    if unshifted is None:
+        unshifted = char.lower()
+    return unshifted
 
 
 def shift_char(char: str) -> str:
@@ -62,4 +69,4 @@ def shift_char(char: str) -> str:
     if len(char) != 1:
         raise ValueError(f"shift_char: input must be a single character, got '{char}'")
 
-    return _SHIFT_MAP.inv.get(char, char.upper())
+    return _SHIFT_MAP.get(char, char.upper())
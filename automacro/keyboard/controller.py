@@ -1,7 +1,32 @@
+import functools
+import sys
+from typing import Tuple
+
 from pynput.keyboard import Controller
+from pynput.keyboard import Key as PynputKey
 
+from automacro.clipboard import copy
+from automacro.keyboard.key import ModifierKey
 from automacro.keyboard.key_sequence import KeySequence
 
+# The platform's paste shortcut
+_PASTE_SEQ = KeySequence(
+    "v", {ModifierKey.CMD if sys.platform == "darwin" else ModifierKey.CTRL}
+)
+
+
+@functools.cache
+def _get_controller() -> Controller:
+    """
+    Get the pynput keyboard controller shared by all key controllers, creating
+    it on first use.
+
+    Returns:
+        pynput.keyboard.Controller: The shared pynput keyboard controller.
+    """
+
+    return Controller()
+
 
 class KeyController:
     """
@@ -13,45 +38,59 @@ class KeyController:
         Initialize the key controller.
         """
 
-        self._controller = None
+        self._controller = _get_controller()
 
-    def press(self, seq: KeySequence):
+    def _press(self, key: str | PynputKey | None, modifiers: Tuple[PynputKey, ...]):
         """
-        Press a key with modifiers.
+        Internal method to press a pynput key with pynput modifiers.
 
         Args:
-            seq (KeySequence): Key sequence to press.
+            key (str | PynputKey | None): The key to press.
+            modifiers (Tuple[PynputKey, ...]): The modifier keys to press, in
+            the order they should be pressed.
         """
 
-        if not self._controller:
-            self._controller = Controller()
-
-        key, modifiers = seq.to_pynput()
-
         for modifier in modifiers:
             self._controller.press(modifier)
         if key:
             self._controller.press(key)
 
-    def release(self, seq: KeySequence):
+    def _release(self, key: str | PynputKey | None, modifiers: Tuple[PynputKey, ...]):
         """
-        Release a key with modifiers.
+        Internal method to release a pynput key with pynput modifiers.
 
         Args:
-            seq (KeySequence): Key sequence to release.
+            key (str | PynputKey | None): The key to release.
+            modifiers (Tuple[PynputKey, ...]): The modifier keys to release, in
+            the order they were pressed.
         """
 
-        if not self._controller:
-            self._controller = Controller()
-
-        key, modifiers = seq.to_pynput()
-
         if key:
             self._controller.release(key)
         # The modifiers are released in reversed order
-        for modifier in reversed(list(modifiers)):
+        for modifier in reversed(modifiers):
             self._controller.release(modifier)
 
+    def press(self, seq: KeySequence):
+        """
+        Press a key with modifiers.
+
+        Args:
+            seq (KeySequence): Key sequence to press.
+        """
+
+        self._press(*seq.to_pynput())
+
+    def release(self, seq: KeySequence):
+        """
+        Release a key with modifiers.
+
+        Args:
+            seq (KeySequence): Key sequence to release.
+        """
+
+        self._release(*seq.to_pynput())
+
     def tap(self, seq: KeySequence):
         """
         Tap a key with modifiers.
@@ -60,20 +99,27 @@ class KeyController:
             seq (KeySequence): Key sequence to tap.
         """
 
-        if not self._controller:
-            self._controller = Controller()
+        key, modifiers = seq.to_pynput()
 
-        self.press(seq)
-        self.release(seq)
+        self._press(key, modifiers)
+        self._release(key, modifiers)
 
-    def type(self, text: str):
+    def type(self, text: str, *, paste_threshold: int | None = None):
         """
         Type a string of characters.
 
         Args:
             text (str): String representing the characters to type.
+            paste_threshold (int | None): If set, text longer than this many
+            characters is copied to the clipboard and inserted with a single
+            paste shortcut instead of being typed one character at a time.
+            Note that this overwrites the current clipboard contents. Default
+            is None.
         """
 
-        if not self._controller:
-            self._controller = Controller()
+        if paste_threshold is not None and len(text) > paste_threshold:
+            copy(text)
+            self.tap(_PASTE_SEQ)
+            return
+
         self._controller.type(text)
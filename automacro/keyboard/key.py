@@ -1,4 +1,5 @@
 from enum import Enum
+from operator import attrgetter
 
 from pynput.keyboard import Key as PynputKey
 
@@ -71,11 +72,7 @@ class Key(Enum):
             Key | None: The corresponding Key enum member, or None if not found.
         """
 
-        for member in cls:
-            if member.value == key:
-                return member
-
-        return None
+        return _PYNPUT_TO_KEY.get(key)
 
     def to_pynput(self) -> PynputKey:
         """
@@ -119,22 +116,7 @@ class ModifierKey(Enum):
             a modifier key.
         """
 
-        map = {
-            PynputKey.ctrl: ModifierKey.CTRL,
-            PynputKey.ctrl_l: ModifierKey.CTRL_L,
-            PynputKey.ctrl_r: ModifierKey.CTRL_R,
-            PynputKey.alt: ModifierKey.ALT,
-            PynputKey.alt_l: ModifierKey.ALT_L,
-            PynputKey.alt_r: ModifierKey.ALT_R,
-            PynputKey.cmd: ModifierKey.CMD,
-            PynputKey.cmd_l: ModifierKey.CMD_L,
-            PynputKey.cmd_r: ModifierKey.CMD_R,
-            PynputKey.shift: ModifierKey.SHIFT,
-            PynputKey.shift_l: ModifierKey.SHIFT_L,
-            PynputKey.shift_r: ModifierKey.SHIFT_R,
-        }
-
-        return map.get(key, None)
+        return _PYNPUT_TO_MOD.get(key)
 
     def to_pynput(self) -> PynputKey:
         """
@@ -144,22 +126,7 @@ class ModifierKey(Enum):
             pynput.keyboard.Key: The corresponding pynput Key.
         """
 
-        mod_to_pynput = {
-            ModifierKey.CTRL: PynputKey.ctrl,
-            ModifierKey.CTRL_L: PynputKey.ctrl_l,
-            ModifierKey.CTRL_R: PynputKey.ctrl_r,
-            ModifierKey.ALT: PynputKey.alt,
-            ModifierKey.ALT_L: PynputKey.alt_l,
-            ModifierKey.ALT_R: PynputKey.alt_r,
-            ModifierKey.CMD: PynputKey.cmd,
-            ModifierKey.CMD_L: PynputKey.cmd_l,
-            ModifierKey.CMD_R: PynputKey.cmd_r,
-            ModifierKey.SHIFT: PynputKey.shift,
-            ModifierKey.SHIFT_L: PynputKey.shift_l,
-            ModifierKey.SHIFT_R: PynputKey.shift_r,
-        }
-
-        return mod_to_pynput[self]
+        return _MOD_TO_PYNPUT[self]
 
     def is_general(self) -> bool:
         """
@@ -169,7 +136,7 @@ class ModifierKey(Enum):
             bool: True if the ModifierKey is general, False otherwise.
         """
 
-        return self.value % 3 == 0
+        return self._is_general
 
     def is_left(self) -> bool:
         """
@@ -179,7 +146,7 @@ class ModifierKey(Enum):
             bool: True if the ModifierKey is left side, False otherwise.
         """
 
-        return self.name.endswith("_L")
+        return self._is_left
 
     def is_right(self) -> bool:
         """
@@ -189,7 +156,7 @@ class ModifierKey(Enum):
             bool: True if the ModifierKey is right side, False otherwise.
         """
 
-        return self.name.endswith("_R")
+        return self._is_right
 
     def general(self) -> "ModifierKey":
         """
@@ -200,8 +167,7 @@ class ModifierKey(Enum):
             ModifierKey: The general form of the modifier key.
         """
 
-        general_value = self.value - (self.value % 3)
-        return ModifierKey(general_value)
+        return _MOD_GENERAL[self.value]
 
     def left(self) -> "ModifierKey":
         """
@@ -213,11 +179,7 @@ class ModifierKey(Enum):
             ModifierKey: The left side variant of the modifier key.
         """
 
-        if self.is_right():
-            return ModifierKey[self.name.replace("_R", "_L")]
-        if self.is_general():
-            return ModifierKey[self.name + "_L"]
-        return self
+        return _MOD_LEFT[self.value]
 
     def right(self) -> "ModifierKey":
         """
@@ -229,11 +191,7 @@ class ModifierKey(Enum):
             ModifierKey: The right side variant of the modifier key.
         """
 
-        if self.is_left():
-            return ModifierKey[self.name.replace("_L", "_R")]
-        if self.is_general():
-            return ModifierKey[self.name + "_R"]
-        return self
+        return _MOD_RIGHT[self.value]
 
     def opposite(self) -> "ModifierKey | None":
         """
@@ -246,11 +204,90 @@ class ModifierKey(Enum):
             or None if the key is in general form.
         """
 
-        if self.is_left():
-            return self.right()
-        if self.is_right():
-            return self.left()
-        return None
+        return _MOD_OPPOSITE[self.value]
+
+
+_PYNPUT_TO_KEY: dict[PynputKey, Key] = {member.value: member for member in Key}
+
+_MOD_TO_PYNPUT: dict[ModifierKey, PynputKey] = {
+    ModifierKey.CTRL: PynputKey.ctrl,
+    ModifierKey.CTRL_L: PynputKey.ctrl_l,
+    ModifierKey.CTRL_R: PynputKey.ctrl_r,
+    ModifierKey.ALT: PynputKey.alt,
+    ModifierKey.ALT_L: PynputKey.alt_l,
+    ModifierKey.ALT_R: PynputKey.alt_r,
+    ModifierKey.CMD: PynputKey.cmd,
+    ModifierKey.CMD_L: PynputKey.cmd_l,
+    ModifierKey.CMD_R: PynputKey.cmd_r,
+    ModifierKey.SHIFT: PynputKey.shift,
+    ModifierKey.SHIFT_L: PynputKey.shift_l,
+    ModifierKey.SHIFT_R: PynputKey.shift_r,
+}
+
+# Built from the forward mapping so that, on platforms where pynput aliases a
+# general modifier to its left variant (e.g. Key.shift and Key.shift_l), the
+# side-specific member wins, as it did with the previous per-call dict
+_PYNPUT_TO_MOD: dict[PynputKey, ModifierKey] = {
+    key: mod for mod, key in _MOD_TO_PYNPUT.items()
+}
+
+# Each modifier as a (general, left, right) group, used to precompute the
+# relations between the variants of a modifier
+_MOD_GROUPS = (
+    (ModifierKey.CTRL, ModifierKey.CTRL_L, ModifierKey.CTRL_R),
+    (ModifierKey.ALT, ModifierKey.ALT_L, ModifierKey.ALT_R),
+    (ModifierKey.CMD, ModifierKey.CMD_L, ModifierKey.CMD_R),
+    (ModifierKey.SHIFT, ModifierKey.SHIFT_L, ModifierKey.SHIFT_R),
+)
+
+# Lookup tables indexed by ModifierKey value. The groups above are listed in
+# value order, so each group contributes three consecutive entries
+_MOD_GENERAL: tuple[ModifierKey, ...] = tuple(
+    group[0] for group in _MOD_GROUPS for _ in group
+)
+_MOD_LEFT: tuple[ModifierKey, ...] = tuple(
+    group[1] for group in _MOD_GROUPS for _ in group
+)
+_MOD_RIGHT: tuple[ModifierKey, ...] = tuple(
+    group[2] for group in _MOD_GROUPS for _ in group
+)
+_MOD_OPPOSITE: tuple[ModifierKey | None, ...] = tuple(
+    opposite
+    for _general, _left, _right in _MOD_GROUPS
+    for opposite in (None, _right, _left)
+)
+
+for _general, _left, _right in _MOD_GROUPS:
+    # Baked onto the members so the is_* predicates are plain attribute reads
+    for _mod, _flags in (
+        (_general, (True, False, False)),
+        (_left, (False, True, False)),
+        (_right, (False, False, True)),
+    ):
+        _mod._is_general, _mod._is_left, _mod._is_right = _flags
+
+del _general, _left, _right, _mod, _flags
+
+for _mod in ModifierKey:
+    # The member's bit in modifier bitmasks, with bit n set for the modifier
+    # with value n
+    _mod._bit = 1 << _mod.value
+
+del _mod
+
+# Orders modifiers by value, i.e. CTRL, ALT, CMD, SHIFT
+_mod_sort_key = attrgetter("value")
+
+_MOD_TO_STR: dict[ModifierKey, str] = {
+    ModifierKey.CTRL: "C",
+    ModifierKey.ALT: "M",
+    ModifierKey.CMD: "D",
+    ModifierKey.SHIFT: "S",
+}
+
+# Memoized stringify_modifiers results, keyed by the bitmask of the modifiers.
+# There are only 4096 possible combinations
+_MASK_TO_STR: dict[int, str] = {}
 
 
 def stringify_modifiers(modifiers: frozenset[ModifierKey]) -> str:
@@ -273,47 +310,54 @@ def stringify_modifiers(modifiers: frozenset[ModifierKey]) -> str:
         an empty string is returned.
     """
 
-    mod_str = ""
+    mask = 0
+    for modifier in modifiers:
+        mask |= modifier._bit
 
-    # We sort the modifiers to ensure they are ordered
-    mods = sorted(modifiers, key=lambda m: m.value)
+    mod_str = _MASK_TO_STR.get(mask)
+    if mod_str is None:
+        mod_str = _MASK_TO_STR[mask] = _stringify_modifiers(modifiers)
+    return mod_str
+
+
+def _stringify_modifiers(modifiers: frozenset[ModifierKey]) -> str:
+    """
+    Build the string representation of a set of modifier keys. See
+    stringify_modifiers, which memoizes the results of this function.
+
+    Args:
+        modifiers (frozenset[ModifierKey]): Set of modifier keys.
+
+    Returns:
+        str: Stringified representation of the modifier keys.
+    """
 
-    mod_to_str = {
-        ModifierKey.CTRL: "C",
-        ModifierKey.ALT: "M",
-        ModifierKey.CMD: "D",
-        ModifierKey.SHIFT: "S",
-    }
+    parts = []
+
+    # We sort the modifiers to ensure they are ordered
+    mods = sorted(modifiers, key=_mod_sort_key)
 
     # Track which general modifiers are already in use, in case of
     # left/right variants. General modifiers take precedence
     # over left/right variants.
-    mod_in_use = {
-        ModifierKey.CTRL: False,
-        ModifierKey.ALT: False,
-        ModifierKey.CMD: False,
-        ModifierKey.SHIFT: False,
-    }
+    mod_in_use = set()
 
     for modifier in mods:
         general = modifier.general()
 
-        if mod_in_use[general]:
+        if general in mod_in_use:
             continue
 
-        if general in mods:
-            mod_in_use[general] = True
+        if general in modifiers:
+            mod_in_use.add(general)
 
-        if modifier.is_general():
+        if modifier._is_general:
             variant_suffix = ""
-        elif modifier.is_left():
+        elif modifier._is_left:
             variant_suffix = "l"
         else:
             variant_suffix = "r"
 
-        mod_str += mod_to_str.get(general, "") + variant_suffix + "-"
+        parts.append(_MOD_TO_STR[general] + variant_suffix)
 
-    if mod_str.endswith("-"):
-        mod_str = mod_str[:-1]
-
-    return mod_str
+    return "-".join(parts)
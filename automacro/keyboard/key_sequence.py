@@ -3,7 +3,12 @@ from typing import Tuple
 from pynput.keyboard import Key as PynputKey
 
 from automacro.keyboard.char import unshift_char
-from automacro.keyboard.key import Key, ModifierKey, stringify_modifiers
+from automacro.keyboard.key import (
+    Key,
+    ModifierKey,
+    _mod_sort_key,
+    stringify_modifiers,
+)
 
 
 class KeySequence:
@@ -11,6 +16,15 @@ class KeySequence:
     A sequence of key inputs.
     """
 
+    __slots__ = (
+        "_key",
+        "_modifiers",
+        "_repeat",
+        "_ignore_modifiers",
+        "_pynput",
+        "_hash",
+    )
+
     def __init__(
         self,
         key: str | Key | None = None,
@@ -57,6 +71,11 @@ class KeySequence:
         self._repeat = repeat
         self._ignore_modifiers = ignore_modifiers
 
+        # Lazily computed pynput representation (see to_pynput)
+        self._pynput = None
+        # Lazily computed hash (see __hash__)
+        self._hash = None
+
     @property
     def key(self) -> str | Key | None:
         return self._key
@@ -73,22 +92,34 @@ class KeySequence:
     def ignore_modifiers(self) -> bool:
         return self._ignore_modifiers
 
-    def to_pynput(self) -> Tuple[str | PynputKey | None, set[PynputKey]]:
+    def to_pynput(self) -> Tuple[str | PynputKey | None, Tuple[PynputKey, ...]]:
         """
         Returns the key and modifiers in pynput format.
 
+        The result is computed on first use and cached, since a key sequence
+        cannot change after construction.
+
         Returns:
-            Tuple[str | PynputKey | None, set[PynputKey]]: A tuple containing
-            the key and a set of modifier keys in pynput format.
+            Tuple[str | PynputKey | None, Tuple[PynputKey, ...]]: A tuple
+            containing the key and a tuple of modifier keys in pynput format,
+            ordered CTRL, ALT, CMD, SHIFT.
         """
 
-        modifiers = {mod.to_pynput() for mod in self.modifiers}
+        if self._pynput is None:
+            modifiers = tuple(
+                mod.to_pynput() for mod in sorted(self._modifiers, key=_mod_sort_key)
+            )
 
-        if isinstance(self.key, Key):
-            return self.key.to_pynput(), modifiers
-        return self.key, modifiers
+            if isinstance(self._key, Key):
+                self._pynput = (self._key.to_pynput(), modifiers)
+            else:
+                self._pynput = (self._key, modifiers)
+
+        return self._pynput
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, KeySequence):
             return NotImplemented
         return (
@@ -99,7 +130,13 @@ class KeySequence:
         )
 
     def __hash__(self):
-        return hash((self.key, self.modifiers, self.repeat, self.ignore_modifiers))
+        # A key sequence cannot change after construction, so its hash is
+        # computed once and reused for every dict and set operation
+        if self._hash is None:
+            self._hash = hash(
+                (self._key, self._modifiers, self._repeat, self._ignore_modifiers)
+            )
+        return self._hash
 
     def __repr__(self):
         return f"<KeyInput {self.stringify_key()} repeat={self.repeat} ignore_modifiers={self.ignore_modifiers}>"
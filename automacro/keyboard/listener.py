@@ -1,6 +1,6 @@
-import itertools
-from typing import Callable
+from typing import Callable, Iterable
 
+from pynput.keyboard import Key as PynputKey
 from pynput.keyboard import Listener
 
 from automacro.core import ThreadPool
@@ -10,15 +10,83 @@ from automacro.keyboard.key_sequence import KeySequence
 from automacro.utils import _get_logger
 
 
+def _get_modifiers_mask(modifiers: Iterable[ModifierKey]) -> int:
+    """
+    Convert a set of modifier keys into a bitmask, with bit n set for the
+    modifier with value n.
+
+    Args:
+        modifiers (Iterable[ModifierKey]): The modifier keys.
+
+    Returns:
+        int: The bitmask of the modifier keys.
+    """
+
+    mask = 0
+    for mod in modifiers:
+        mask |= mod._bit
+    return mask
+
+
+# The modifier and key that each special pynput key resolves to
+_PYNPUT_KEY_INFO: dict[PynputKey, tuple[ModifierKey | None, Key | None]] = {
+    key: (ModifierKey.from_pynput(key), Key.from_pynput(key)) for key in PynputKey
+}
+
+
+def _resolve_key(key) -> tuple[ModifierKey | None, str | Key | None]:
+    """
+    Resolve a key from a pynput event into its modifier and key.
+
+    Args:
+        key (pynput.keyboard.Key | pynput.keyboard.KeyCode | None): The key
+        from the pynput event. pynput passes None for unknown keys.
+
+    Returns:
+        tuple[ModifierKey | None, str | Key | None]: The modifier key, or None
+        if the key is not a modifier, and the unshifted character or special
+        key, or None if it is neither.
+    """
+
+    # Special keys resolve with a single table lookup. Anything else is a
+    # KeyCode, which is never a modifier and is looked up by its character
+    # only, since hashing a KeyCode is comparatively expensive
+    if isinstance(key, PynputKey):
+        return _PYNPUT_KEY_INFO[key]
+
+    if key is None:
+        return None, None
+
+    char = key.char
+    return None, unshift_char(char) if char else None
+
+
 class KeyListener:
     """
     A listener for character key presses.
     """
 
+    __slots__ = (
+        "_has_callbacks",
+        "_callbacks_exact_repeat",
+        "_callbacks_exact_once",
+        "_callbacks_subset",
+        "_release_by_modifier",
+        "_release_by_key",
+        "_listener",
+        "_modifiers_mask",
+        "_keys_pressed",
+        "_owns_thread_pool",
+        "_thread_pool",
+        "_dispatch",
+        "_logger",
+    )
+
     def __init__(
         self,
         callbacks: dict[KeySequence, Callable[[], None]] | None = None,
         thread_pool: ThreadPool | None = None,
+        inline_callbacks: bool = False,
     ):
         """
         Initialize the key listener.
@@ -29,27 +97,31 @@ class KeyListener:
             thread_pool (ThreadPool | None): Optional shared thread pool for
             executing callbacks. If None, callbacks will be executed in a
             single dedicated thread. Default is None.
+            inline_callbacks (bool): If True, callbacks are executed directly
+            on the listener thread instead of being submitted to a thread
+            pool, which avoids the hand-off latency for cheap callbacks. Key
+            events are not processed while a callback runs, so this should
+            only be used with callbacks that return quickly. Default is False.
         """
 
         self._init_callbacks(callbacks)
 
         self._listener = Listener(on_press=self._on_press, on_release=self._on_release)
-        self._modifiers = set()
+        # Bitmask of the pressed modifiers (see _get_modifiers_mask)
+        self._modifiers_mask = 0
         self._keys_pressed = set()
 
-        self._owns_thread_pool = thread_pool is None
-        self._thread_pool = thread_pool or ThreadPool(1)
+        if inline_callbacks:
+            self._owns_thread_pool = False
+            self._thread_pool = thread_pool
+            self._dispatch = self._run_inline
+        else:
+            self._owns_thread_pool = thread_pool is None
+            self._thread_pool = thread_pool or ThreadPool(1)
+            self._dispatch = self._thread_pool.submit
 
         self._logger = _get_logger(self.__class__)
 
-    def __del__(self):
-        try:
-            if self._owns_thread_pool and self._thread_pool:
-                # We don't wait for tasks to complete to avoid blocking
-                self._thread_pool.shutdown(wait=False)
-        except Exception as e:
-            self._logger.error(f"Error shutting down thread pool: {e}")
-
     def __enter__(self):
         self.start()
         return self
@@ -57,40 +129,13 @@ class KeyListener:
     def __exit__(self, *_):
         self.stop()
 
-    def _generate_modifier_subsets(self) -> list[set[ModifierKey]]:
-        """
-        Generate all possible subsets of modifier variant keys.
-
-        Returns:
-            list[set[ModifierKey]]: A list of sets, each containing a unique
-            subset of modifier variant keys.
-        """
-
-        mods = {
-            ModifierKey.CTRL_L,
-            ModifierKey.CTRL_R,
-            ModifierKey.ALT_L,
-            ModifierKey.ALT_R,
-            ModifierKey.CMD_L,
-            ModifierKey.CMD_R,
-            ModifierKey.SHIFT_L,
-            ModifierKey.SHIFT_R,
-        }
-
-        subsets = []
-        for r in range(len(mods) + 1):
-            subsets.extend(set(p) for p in itertools.combinations(mods, r))
-        return subsets
-
-    def _normalize_modifiers(
-        self, modifiers: frozenset[ModifierKey]
-    ) -> list[set[ModifierKey]]:
+    def _normalize_modifiers(self, modifiers: frozenset[ModifierKey]) -> list[int]:
         """
         Normalize a given set of modifiers by expanding any general modifier
         keys into their respective combinations and returning all possible unique
-        combinations between left and right variants of the modifier keys. The
-        combinations are generated using the Cartesian product of the expanded
-        modifier sets.
+        combinations between left and right variants of the modifier keys, as
+        bitmasks (see _get_modifiers_mask). The combinations are generated
+        using the Cartesian product of the expanded modifier sets.
 
         The Cartesian product is computed as P = C x M x D x S, where:
         - C is the set of CTRL variants (CTRL_L, CTRL_R) after expansion
@@ -103,24 +148,23 @@ class KeyListener:
             normalize.
 
         Returns:
-            list[set[ModifierKey]]: A list of sets, each containing a unique
+            list[int]: A list of bitmasks, each representing a unique
             combination of modifier keys.
         """
 
-        specific_mods = {mod for mod in modifiers if not mod.is_general()}
+        masks = [_get_modifiers_mask(mod for mod in modifiers if not mod.is_general())]
 
-        variant_combinations = []
+        # Each general modifier doubles the combinations, with either its left
+        # or its right variant set
         for mod in modifiers:
             if mod.is_general():
-                variant_combinations.append([mod.left(), mod.right()])
-
-        expanded_combinations = tuple(itertools.product(*variant_combinations))
+                left, right = mod.left()._bit, mod.right()._bit
+                masks = [mask | bit for mask in masks for bit in (left, right)]
 
-        mods = []
-        for comb in expanded_combinations:
-            mods.append(set(comb) | specific_mods)
-
-        return mods
+        # A general modifier listed together with its variants produces the
+        # same combination more than once, which would register a callback
+        # several times. Drop the duplicates, keeping the order
+        return list(dict.fromkeys(masks))
 
     def _init_callbacks(
         self,
@@ -137,14 +181,31 @@ class KeyListener:
         if not callbacks:
             callbacks = {}
 
-        self._callbacks_exact = {}
-        self._callbacks_subset = []
-
-        # Create a mapping for all possible modifier variant subsets for fast
-        # loopup during key events (for exact modifier matches)
-        for subset in self._generate_modifier_subsets():
-            key = KeySequence(None, frozenset(subset))
-            self._callbacks_exact[key] = {}
+        self._has_callbacks = bool(callbacks)
+
+        # Exact modifier match callbacks, keyed by the bitmask of the pressed
+        # modifier variants and the key, so that a key event resolves with a
+        # single lookup. Repeat and non-repeat callbacks are kept apart so
+        # that dispatching them needs no per-event check of the key sequence
+        self._callbacks_exact_repeat: dict[
+            tuple[int, str | Key | None], list[Callable[[], None]]
+        ] = {}
+        self._callbacks_exact_once: dict[
+            tuple[int, str | Key | None],
+            list[tuple[KeySequence, Callable[[], None]]],
+        ] = {}
+        # Subset modifier match callbacks, keyed by the key, with the bitmasks
+        # of the modifier variant combinations that satisfy them
+        self._callbacks_subset: dict[
+            str | Key | None,
+            list[tuple[KeySequence, Callable[[], None], tuple[int, ...]]],
+        ] = {}
+
+        # Registered non-repeat key sequences indexed by each of their
+        # modifiers and by their key, so that a release only visits the
+        # sequences it can affect
+        self._release_by_modifier: dict[ModifierKey, list[KeySequence]] = {}
+        self._release_by_key: dict[str | Key, list[KeySequence]] = {}
 
         for k, cb in callbacks.items():
             # Create a copy of the key sequence to avoid users affecting
@@ -157,16 +218,43 @@ class KeyListener:
                 ignore_modifiers=k.ignore_modifiers,
             )
 
-            normalized_modifiers = self._normalize_modifiers(k.modifiers)
+            if not k.repeat:
+                for mod in k_copy.modifiers:
+                    self._release_by_modifier.setdefault(mod, []).append(k_copy)
+                if k_copy.key is not None:
+                    self._release_by_key.setdefault(k_copy.key, []).append(k_copy)
+
+            masks = tuple(self._normalize_modifiers(k.modifiers))
 
-            for mod_comb in normalized_modifiers:
-                mod_set = KeySequence(None, frozenset(mod_comb))
+            if k.ignore_modifiers:
+                # We store subset matching callbacks in a separate table
+                self._callbacks_subset.setdefault(k_copy.key, []).append(
+                    (k_copy, cb, masks)
+                )
+                continue
 
-                if k.ignore_modifiers:
-                    # We store subset matching callbacks in a separate list
-                    self._callbacks_subset.append((k_copy, cb))
+            for mask in masks:
+                lookup_key = (mask, k_copy.key)
+                if k.repeat:
+                    self._callbacks_exact_repeat.setdefault(lookup_key, []).append(cb)
                 else:
-                    self._callbacks_exact[mod_set][k_copy] = cb
+                    self._callbacks_exact_once.setdefault(lookup_key, []).append(
+                        (k_copy, cb)
+                    )
+
+    def _run_inline(self, cb: Callable[[], None]):
+        """
+        Execute a callback on the listener thread, logging any error it raises
+        so that it does not stop the listener.
+
+        Args:
+            cb (Callable[[], None]): The callback function to execute.
+        """
+
+        try:
+            cb()
+        except Exception as e:
+            self._logger.error(f"Error in key listener callback: {e}")
 
     def _trigger(self, k: KeySequence, cb: Callable[[], None]):
         """
@@ -179,83 +267,87 @@ class KeyListener:
 
         # Call the callback if the key sequence is a repeat action
         if k.repeat:
-            self._thread_pool.submit(cb)
+            self._dispatch(cb)
         # If not a repeat action, only call if the key is not already pressed
         elif not k.repeat and k not in self._keys_pressed:
             self._keys_pressed.add(k)
-            self._thread_pool.submit(cb)
+            self._dispatch(cb)
 
     def _on_press(self, key):
         """
         Callback function for key press event.
         """
 
-        if not self._callbacks_exact:
+        if not self._has_callbacks:
             return
 
-        modifier = ModifierKey.from_pynput(key)
-        if modifier:
+        modifier, seq_key = _resolve_key(key)
+        if modifier is not None:
             # If both sides of the modifier were already pressed but we receive
             # another press event for one side, we treat it as a release for
             # that side.
             # This is a workaround for a pynput bug where pressing both sides
             # of a modifier key and releasing one side generates a press event
             # instead of a release event.
-            if modifier in self._modifiers and modifier.opposite() in self._modifiers:
+            opposite = modifier.opposite()
+            if (
+                self._modifiers_mask & modifier._bit
+                and opposite is not None
+                and self._modifiers_mask & opposite._bit
+            ):
                 self._on_release(key)
                 return
-            self._modifiers.add(modifier)
-
-        if hasattr(key, "char") and key.char:
-            seq_key = unshift_char(key.char)
-        else:
-            seq_key = Key.from_pynput(key)
+            self._modifiers_mask |= modifier._bit
 
-        pressed_mods = frozenset(self._modifiers)
-        mod_set = KeySequence(None, pressed_mods)
+        pressed_mods = self._modifiers_mask
+        lookup_key = (pressed_mods, seq_key)
+        dispatch = self._dispatch
 
         # Exact modifier match callbacks
-        for k, cb in self._callbacks_exact[mod_set].items():
-            if k.key == seq_key:
-                self._trigger(k, cb)
+        for cb in self._callbacks_exact_repeat.get(lookup_key, ()):
+            dispatch(cb)
 
-        # Subset modifier match callbacks
-        for k, cb in self._callbacks_subset:
-            if k.key != seq_key:
-                continue
+        keys_pressed = self._keys_pressed
+        for k, cb in self._callbacks_exact_once.get(lookup_key, ()):
+            # Only call if the key is not already pressed
+            if k not in keys_pressed:
+                keys_pressed.add(k)
+                dispatch(cb)
 
+        # Subset modifier match callbacks
+        for k, cb, masks in self._callbacks_subset.get(seq_key, ()):
             # Check if the key sequence's modifiers are a subset of the
             # pressed modifiers
-            if k.modifiers.issubset(pressed_mods):
-                self._trigger(k, cb)
+            for mask in masks:
+                if mask & pressed_mods == mask:
+                    self._trigger(k, cb)
+                    break
 
     def _on_release(self, key):
         """
         Callback function for key release event.
         """
 
-        if not self._callbacks_exact:
+        if not self._has_callbacks:
             return
 
-        modifier = ModifierKey.from_pynput(key)
-        if modifier:
-            for k in list(self._keys_pressed):
-                if modifier in k.modifiers:
-                    self._keys_pressed.discard(k)
-                # Check if the opposite side modifier is pressed.
-                # It could be the case that the opposite side is still pressed
-                # so we don't want to discard the key in that case.
-                if (
-                    modifier.opposite() not in self._modifiers
-                    and modifier.general() in k.modifiers
-                ):
-                    self._keys_pressed.discard(k)
-            self._modifiers.discard(modifier)
-
-        if hasattr(key, "char") and key.char:
-            for k in list(self._keys_pressed):
-                if k.key == unshift_char(key.char):
-                    self._keys_pressed.discard(k)
+        discard = self._keys_pressed.discard
+
+        modifier, seq_key = _resolve_key(key)
+        if modifier is not None:
+            for k in self._release_by_modifier.get(modifier, ()):
+                discard(k)
+            # Check if the opposite side modifier is pressed.
+            # It could be the case that the opposite side is still pressed
+            # so we don't want to discard the key in that case.
+            opposite = modifier.opposite()
+            if opposite is None or not self._modifiers_mask & opposite._bit:
+                for k in self._release_by_modifier.get(modifier.general(), ()):
+                    discard(k)
+            self._modifiers_mask &= ~modifier._bit
+
+        for k in self._release_by_key.get(seq_key, ()):
+            discard(k)
 
     def start(self):
         """
@@ -1,3 +1,4 @@
+import functools
 import time
 from typing import Callable
 
@@ -8,22 +9,17 @@ from automacro.mouse.mouse_button import MouseButton
 from automacro.screen.coordinates import get_screen_size
 
 
-def _clamp_to_screen_bounds(x: int, y: int) -> tuple[int, int]:
+@functools.cache
+def _get_controller() -> Controller:
     """
-    Clamp the given (x, y) coordinates to be within the screen bounds.
-
-    Args:
-        x (int): The x-coordinate.
-        y (int): The y-coordinate.
+    Get the pynput mouse controller shared by all mouse controllers, creating
+    it on first use.
 
     Returns:
-        tuple[int, int]: The clamped (x, y) coordinates.
+        pynput.mouse.Controller: The shared pynput mouse controller.
     """
 
-    screen_width, screen_height = get_screen_size()
-    clamped_x = max(0, min(x, screen_width - 1))
-    clamped_y = max(0, min(y, screen_height - 1))
-    return clamped_x, clamped_y
+    return Controller()
 
 
 class MouseController:
@@ -36,7 +32,39 @@ class MouseController:
         Initialize the mouse controller.
         """
 
-        self._controller = None
+        self._controller = _get_controller()
+
+        # Largest valid (x, y) coordinates on the screen, retrieved on first
+        # use since querying the screen size goes through the OS
+        self._bounds: tuple[int, int] | None = None
+
+    def _clamp_to_screen_bounds(self, x: int, y: int) -> tuple[int, int]:
+        """
+        Clamp the given (x, y) coordinates to be within the screen bounds.
+
+        Args:
+            x (int): The x-coordinate.
+            y (int): The y-coordinate.
+
+        Returns:
+            tuple[int, int]: The clamped (x, y) coordinates.
+        """
+
+        if self._bounds is None:
+            screen_width, screen_height = get_screen_size()
+            self._bounds = (screen_width - 1, screen_height - 1)
+
+        max_x, max_y = self._bounds
+        return max(0, min(x, max_x)), max(0, min(y, max_y))
+
+    def invalidate_display_cache(self):
+        """
+        Discard the cached screen bounds, so they are retrieved again on the
+        next movement. Call this after the display configuration changes
+        (e.g. a resolution change).
+        """
+
+        self._bounds = None
 
     def _move_to(
         self,
@@ -57,15 +85,12 @@ class MouseController:
             the movement. Default is linear.
         """
 
-        if not self._controller:
-            self._controller = Controller()
-
         if duration <= 0.0:
-            self._controller.position = _clamp_to_screen_bounds(x, y)
+            self._controller.position = self._clamp_to_screen_bounds(x, y)
             return
 
         start = tuple(float(coord) for coord in self.position)
-        end = tuple(float(coord) for coord in _clamp_to_screen_bounds(x, y))
+        end = tuple(float(coord) for coord in self._clamp_to_screen_bounds(x, y))
 
         fps = 120.0
         delay = 1.0 / fps
@@ -90,8 +115,6 @@ class MouseController:
         Current (x, y) position of the mouse.
         """
 
-        if not self._controller:
-            self._controller = Controller()
         x, y = self._controller.position
         return int(x), int(y)
 
@@ -152,8 +175,6 @@ class MouseController:
             button (MouseButton): Mouse button to hold down.
         """
 
-        if not self._controller:
-            self._controller = Controller()
         self._controller.press(button.to_pynput())
 
     def release(self, button: MouseButton):
@@ -164,8 +185,6 @@ class MouseController:
             button (MouseButton): Mouse button to release.
         """
 
-        if not self._controller:
-            self._controller = Controller()
         self._controller.release(button.to_pynput())
 
     def click(self, button: MouseButton, count: int = 1):
@@ -177,8 +196,6 @@ class MouseController:
             count (int): Number of times to click the button. Default is 1.
         """
 
-        if not self._controller:
-            self._controller = Controller()
         self._controller.click(button.to_pynput(), count)
 
     def scroll(self, dx: int, dy: int):
@@ -186,6 +203,4 @@ class MouseController:
         Scroll the mouse by the specified amounts in the x and y directions.
         """
 
-        if not self._controller:
-            self._controller = Controller()
         self._controller.scroll(dx, dy)
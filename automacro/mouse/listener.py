@@ -1,3 +1,6 @@
+import threading
+import time
+from collections import deque
 from typing import Callable
 
 from pynput.mouse import Button, Listener
@@ -7,6 +10,173 @@ from automacro.mouse.mouse_button import MouseButton
 from automacro.utils import _get_logger
 
 
+class _EventDispatcher:
+    """
+    Delivers mouse event callbacks in order on a single worker thread.
+
+    Events are kept in a buffer that is appended to by the pynput listener
+    thread and drained by the worker, so delivering an event costs no Future.
+    If the callbacks fall so far behind that the buffer holds max_pending
+    events, further move events are dropped until the worker catches up,
+    keeping only the latest dropped position. It is delivered before the
+    next click or scroll, or once the buffer is drained, so events are never
+    reordered. Click and scroll events are never dropped.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 4096,
+        moves: Callable | None = None,
+        coalesce_moves: bool = False,
+    ):
+        """
+        Initialize the event dispatcher. The worker thread is started on the
+        first submitted event.
+
+        Args:
+            max_pending (int): The number of undelivered events beyond which
+            move events are dropped. Default is 4096.
+            moves (Callable | None): The move callback. Only events submitted
+            for this callback may be dropped or coalesced. Default is None.
+            coalesce_moves (bool): If True, consecutive queued move events are
+            collapsed into the last one when draining, so the move callback
+            only receives the latest position of each run. Default is False.
+        """
+
+        self._events = deque()
+        self._max_pending = max_pending
+        self._moves = moves
+        self._coalesce = moves if coalesce_moves else None
+
+        # Latest move dropped because the buffer was full, and whether a
+        # warning has been logged since the buffer was last drained
+        self._dropped_move: tuple | None = None
+        self._overflowing = False
+        self._overflow_lock = threading.Lock()
+
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+        self._logger = _get_logger(self.__class__)
+
+    def submit(self, fn: Callable, *args):
+        """
+        Queue a callback for execution on the worker thread.
+
+        Args:
+            fn (Callable): The function to execute.
+            *args: Arguments for the function.
+
+        Raises:
+            RuntimeError: If the dispatcher has been shut down.
+        """
+
+        if self._stopped:
+            raise RuntimeError("_EventDispatcher: cannot submit after shutdown")
+
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+        events = self._events
+
+        if fn is self._moves:
+            if len(events) >= self._max_pending:
+                with self._overflow_lock:
+                    self._dropped_move = args
+                    if not self._overflowing:
+                        self._overflowing = True
+                        self._logger.warning(
+                            f"Mouse callbacks are more than {self._max_pending} "
+                            "events behind, dropping mouse move events"
+                        )
+                self._wake.set()
+                return
+        elif self._dropped_move is not None:
+            # Keep the dropped position ahead of this event, where it belongs
+            with self._overflow_lock:
+                dropped_move = self._dropped_move
+                self._dropped_move = None
+            if dropped_move is not None:
+                events.append((self._moves, dropped_move))
+
+        events.append((fn, args))
+        self._wake.set()
+
+    def _call(self, fn: Callable, args: tuple):
+        """
+        Execute a callback, logging any error it raises.
+
+        Args:
+            fn (Callable): The function to execute.
+            args (tuple): Arguments for the function.
+        """
+
+        try:
+            fn(*args)
+        except Exception as e:
+            self._logger.error(f"Error in mouse listener callback: {e}")
+
+    def _drain(self):
+        """
+        Execute all queued callbacks, then the latest dropped move, if any.
+        """
+
+        events = self._events
+        coalesce = self._coalesce
+
+        while True:
+            while events:
+                fn, args = events.popleft()
+                if coalesce is not None and fn is coalesce:
+                    # Skip ahead to the last of a run of coalesced events
+                    while events and events[0][0] is coalesce:
+                        fn, args = events.popleft()
+                self._call(fn, args)
+
+            with self._overflow_lock:
+                dropped_move = self._dropped_move
+                self._dropped_move = None
+                self._overflowing = False
+
+            if dropped_move is None:
+                return
+            self._call(self._moves, dropped_move)
+
+    def _run(self):
+        """
+        Worker thread loop.
+        """
+
+        while not self._stopped:
+            self._wake.wait()
+            self._wake.clear()
+            self._drain()
+
+        # Deliver events queued before the dispatcher was shut down
+        self._drain()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shutdown the dispatcher. Events already queued are still delivered.
+
+        Args:
+            wait (bool): If True, wait for the queued events to be delivered
+            before returning. Default is True.
+        """
+
+        self._stopped = True
+        self._wake.set()
+
+        thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+
 class MouseListener:
     """
     A listener for mouse events.
@@ -18,6 +188,8 @@ class MouseListener:
         on_click: Callable[[int, int, MouseButton, bool], None] | None = None,
         on_scroll: Callable[[int, int, int, int], None] | None = None,
         thread_pool: ThreadPool | None = None,
+        coalesce_moves: bool = False,
+        move_interval: float = 0.0,
     ):
         """
         Initialize the mouse listener.
@@ -34,14 +206,45 @@ class MouseListener:
             Optional callback function for mouse scroll events. The function
             should accept four arguments: x, y, dx, and dy. Default is None.
             thread_pool (ThreadPool | None): Optional shared thread pool for
-            executing callbacks. If None, callbacks will be executed in a
-            dedicated thread. Default is None.
+            executing callbacks. If None, callbacks will be executed in order
+            in a dedicated thread. If the callbacks then fall more than 4096
+            events behind, move events are dropped (with a warning logged)
+            until they catch up, except for the latest position. Click and
+            scroll events are never dropped. Default is None.
+            coalesce_moves (bool): If True, mouse move events that arrive while
+            a previous move is still waiting to be delivered replace it, so
+            the move callback only receives the latest position instead of
+            falling behind during fast movements. Default is False.
+            move_interval (float): Minimum time (in seconds) between two
+            deliveries of mouse move events. Moves that arrive sooner after
+            the last delivered one are dropped, except that the most recent
+            dropped position is delivered once the interval has passed, so
+            the move callback always receives where the mouse came to rest.
+            If 0.0, every move is delivered. Default is 0.0.
         """
 
         self._move_callback = on_move
         self._click_callback = on_click
         self._scroll_callback = on_scroll
 
+        # Our own dispatcher coalesces queued moves as it drains them, so the
+        # bookkeeping below is only needed with a shared thread pool
+        self._coalesce_moves = coalesce_moves and thread_pool is not None
+        # Latest undelivered move position, and whether a task delivering it
+        # has been submitted (only used when coalescing moves)
+        self._pending_move: tuple[int, int] | None = None
+        self._move_scheduled = False
+        self._move_lock = threading.Lock()
+
+        self._move_interval = move_interval
+        # Time of the last move delivered, the latest move dropped since, and
+        # the timer that delivers it once the interval has passed (only used
+        # when throttling moves)
+        self._last_move_time = float("-inf")
+        self._throttled_move: tuple[int, int] | None = None
+        self._throttle_timer: threading.Timer | None = None
+        self._throttle_lock = threading.Lock()
+
         self._listener = Listener(
             on_move=self._on_move,
             on_click=self._on_click,
@@ -49,18 +252,12 @@ class MouseListener:
         )
 
         self._owns_thread_pool = thread_pool is None
-        self._thread_pool = thread_pool or ThreadPool(1)
+        self._thread_pool = thread_pool or _EventDispatcher(
+            moves=on_move, coalesce_moves=coalesce_moves
+        )
 
         self._logger = _get_logger(self.__class__)
 
-    def __del__(self):
-        try:
-            if self._owns_thread_pool and self._thread_pool:
-                # We don't wait for tasks to complete to avoid blocking
-                self._thread_pool.shutdown(wait=False)
-        except Exception as e:
-            self._logger.error(f"Error shutting down thread pool: {e}")
-
     def __enter__(self):
         self.start()
         return self
@@ -77,8 +274,105 @@ class MouseListener:
             y (int): The y-coordinate of the mouse move.
         """
 
-        if self._move_callback:
+        if not self._move_callback:
+            return
+
+        if self._move_interval > 0.0:
+            self._throttle_move(x, y)
+            return
+
+        self._dispatch_move(x, y)
+
+    def _throttle_move(self, x: int, y: int):
+        """
+        Dispatch a mouse move position unless one was dispatched less than
+        move_interval ago. In that case, keep it as the latest dropped
+        position, and schedule its delivery for when the interval has passed.
+
+        Args:
+            x (int): The x-coordinate of the mouse move.
+            y (int): The y-coordinate of the mouse move.
+        """
+
+        # Dispatching under the lock keeps the positions in order with the
+        # ones delivered by the timer
+        with self._throttle_lock:
+            now = time.monotonic()
+            remaining = self._last_move_time + self._move_interval - now
+
+            if remaining > 0.0:
+                self._throttled_move = (x, y)
+                if self._throttle_timer is None:
+                    timer = threading.Timer(remaining, self._flush_throttled_move)
+                    timer.daemon = True
+                    self._throttle_timer = timer
+                    timer.start()
+                return
+
+            self._last_move_time = now
+            self._throttled_move = None
+            self._dispatch_move(x, y)
+
+    def _flush_throttled_move(self):
+        """
+        Dispatch the latest mouse move position dropped by throttling, if any.
+        """
+
+        with self._throttle_lock:
+            self._throttle_timer = None
+            throttled_move = self._throttled_move
+            if throttled_move is None:
+                return
+
+            self._throttled_move = None
+            self._last_move_time = time.monotonic()
+            try:
+                self._dispatch_move(*throttled_move)
+            except RuntimeError:
+                # The thread pool has already been shut down
+                pass
+
+    def _dispatch_move(self, x: int, y: int):
+        """
+        Hand a mouse move position over to the thread pool for delivery to
+        the move callback.
+
+        Args:
+            x (int): The x-coordinate of the mouse move.
+            y (int): The y-coordinate of the mouse move.
+        """
+
+        if not self._coalesce_moves:
             self._thread_pool.submit(self._move_callback, x, y)
+            return
+
+        with self._move_lock:
+            self._pending_move = (x, y)
+            if self._move_scheduled:
+                return
+            self._move_scheduled = True
+
+        self._thread_pool.submit(self._deliver_moves)
+
+    def _deliver_moves(self):
+        """
+        Deliver pending mouse move positions to the move callback until none
+        are left. Positions that arrive while the callback runs overwrite each
+        other, so only the latest one is delivered next.
+        """
+
+        while True:
+            with self._move_lock:
+                pos = self._pending_move
+                self._pending_move = None
+                if pos is None:
+                    self._move_scheduled = False
+                    return
+
+            try:
+                self._move_callback(*pos)
+            except Exception as e:
+                self._logger.error(f"Error in mouse move callback: {e}")
 
     def _on_click(self, x: int, y: int, button: Button, pressed: bool):
         """
@@ -128,6 +422,14 @@ class MouseListener:
         if self._listener:
             self._listener.stop()
 
+        # Deliver the last position dropped by move throttling right away,
+        # rather than waiting for its timer, so the move callback does not
+        # miss where the mouse came to rest
+        timer = self._throttle_timer
+        if timer is not None:
+            timer.cancel()
+        self._flush_throttled_move()
+
         if self._owns_thread_pool and self._thread_pool:
             try:
                 # We don't wait for tasks to complete to avoid blocking
@@ -25,13 +25,7 @@ class MouseButton(Enum):
             None if not found.
         """
 
-        if button == Button.left:
-            return cls.LEFT
-        if button == Button.right:
-            return cls.RIGHT
-        if button == Button.middle:
-            return cls.MIDDLE
-        return None
+        return _PYNPUT_TO_BUTTON.get(button)
 
     def to_pynput(self) -> Button:
         """
@@ -42,3 +36,8 @@ class MouseButton(Enum):
         """
 
         return self.value
+
+
+_PYNPUT_TO_BUTTON: dict[Button, MouseButton] = {
+    member.value: member for member in MouseButton
+}
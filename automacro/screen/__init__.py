@@ -1,6 +1,6 @@
 from . import ocr
 from .capture import capture
-from .color import get_pixel, hex_to_rgb, is_pixel, rgb_to_hex
+from .color import close_pixel_cache, get_pixel, hex_to_rgb, is_pixel, rgb_to_hex
 from .coordinates import (
     center,
     get_scale_factor,
@@ -20,6 +20,7 @@ from .types import RGB, BBox, Point, Size
 __all__ = [
     "ocr",
     "capture",
+    "close_pixel_cache",
     "get_pixel",
     "hex_to_rgb",
     "is_pixel",
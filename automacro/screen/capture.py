@@ -1,11 +1,40 @@
+import threading
+
 import mss
 from PIL import Image
 
 from automacro.screen.types import BBox
 
-# Create a single mss instance to be reused for all captures.
-# This is more efficient than creating a new instance for each capture.
-_sct = mss.mss()
+# Reuse mss instances across captures, which is more efficient than creating
+# a new instance for each capture. mss instances hold platform display
+# handles that cannot be shared between threads, so there is one per thread.
+_local = threading.local()
+
+
+def _get_sct() -> "mss.base.MSSBase":
+    """
+    Get the mss instance for the current thread, creating it on first use.
+
+    Returns:
+        mss.base.MSSBase: The mss instance for the current thread.
+    """
+
+    sct = getattr(_local, "sct", None)
+    if sct is None:
+        sct = _local.sct = mss.mss()
+    return sct
+
+
+def _close_sct():
+    """
+    Close the mss instance of the current thread, if it has one. A new
+    instance is created on the next capture from this thread.
+    """
+
+    sct = getattr(_local, "sct", None)
+    if sct is not None:
+        _local.sct = None
+        sct.close()
 
 
 def capture(region: BBox | None = None) -> Image.Image:
@@ -20,8 +49,10 @@ def capture(region: BBox | None = None) -> Image.Image:
         PIL.Image.Image: The captured screenshot image.
     """
 
+    sct = _get_sct()
+
     monitor = (
-        _sct.monitors[1]
+        sct.monitors[1]
         if region is None
         else {
             "left": region[0],
@@ -31,7 +62,7 @@ def capture(region: BBox | None = None) -> Image.Image:
         }
     )
 
-    sct_img = _sct.grab(monitor)
+    sct_img = sct.grab(monitor)
 
     # Convert to PIL Image
     img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
@@ -1,9 +1,10 @@
 import re
 
-import mss
-
+from automacro.screen.capture import _close_sct, _get_sct
 from automacro.screen.types import RGB
 
+_HEX_COLOR_RE = re.compile(r"^#[0-9a-fA-F]{6}$")
+
 
 def get_pixel(x: int, y: int) -> RGB:
     """
@@ -19,14 +20,26 @@ def get_pixel(x: int, y: int) -> RGB:
         where each value ranges from 0 to 255.
     """
 
-    with mss.mss() as sct:
-        monitor = {"left": x, "top": y, "width": 1, "height": 1}
+    monitor = {"left": x, "top": y, "width": 1, "height": 1}
+
+    img = _get_sct().grab(monitor)
+
+    r, g, b = tuple(img.rgb[:3])
 
-        img = sct.grab(monitor)
+    return r, g, b
 
-        r, g, b = tuple(img.rgb[:3])
 
-        return r, g, b
+def close_pixel_cache():
+    """
+    Release the screen capture handle cached for the current thread.
+
+    Pixel reads and captures reuse a display handle per thread, which is
+    otherwise kept open until the thread exits. Call this from a thread that
+    is done reading the screen to release it early. Reading the screen again
+    afterwards opens a new handle.
+    """
+
+    _close_sct()
 
 
 def is_pixel(x: int, y: int, expected: RGB, tolerance: int = 0) -> bool:
@@ -46,8 +59,17 @@ def is_pixel(x: int, y: int, expected: RGB, tolerance: int = 0) -> bool:
         tolerance, False otherwise.
     """
 
-    pixel = get_pixel(x, y)
-    return all(abs(pixel[i] - expected[i]) <= tolerance for i in range(3))
+    r, g, b = get_pixel(x, y)
+    expected_r, expected_g, expected_b = expected
+
+    if tolerance == 0:
+        return r == expected_r and g == expected_g and b == expected_b
+
+    return (
+        abs(r - expected_r) <= tolerance
+        and abs(g - expected_g) <= tolerance
+        and abs(b - expected_b) <= tolerance
+    )
 
 
 def rgb_to_hex(rgb: RGB) -> str:
@@ -62,11 +84,13 @@ def rgb_to_hex(rgb: RGB) -> str:
         str: The hexadecimal color string in the format '#RRGGBB'.
     """
 
+    r, g, b = rgb
+
     # Invalid RGB values check
-    if any(not (0 <= value <= 255) for value in rgb):
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
         raise ValueError("RGB values must be in the range 0-255.")
 
-    return "#{:02x}{:02x}{:02x}".format(rgb[0], rgb[1], rgb[2]).upper()
+    return "#" + bytes((r, g, b)).hex().upper()
 
 
 def hex_to_rgb(hex_color: str) -> RGB:
@@ -80,18 +104,12 @@ def hex_to_rgb(hex_color: str) -> RGB:
         tuple[int, int, int]: The RGB color as a tuple (R, G, B).
     """
 
-    hex_pattern = re.compile(r"^#[0-9a-fA-F]{6}$")
-
-    if not hex_pattern.match(hex_color):
+    if not _HEX_COLOR_RE.match(hex_color):
         raise ValueError(
             "Hex color must be in the format '#RRGGBB' with valid hex digits."
         )
 
-    # Remove the leading '#'
-    hex_color = hex_color.lstrip("#")
-
-    red = int(hex_color[0:2], 16)
-    green = int(hex_color[2:4], 16)
-    blue = int(hex_color[4:6], 16)
+    # Parse the digits after the leading '#' at once and shift out the channels
+    value = int(hex_color[1:], 16)
 
-    return (red, green, blue)
+    return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
@@ -1,22 +1,82 @@
-import platform
+import ctypes
+import functools
 import subprocess
+import sys
+import threading
 
 import pyautogui as pag
 
 from automacro.screen.types import BBox, Point, Size
 
-_SCALE = 1.0
+_IS_DARWIN = sys.platform == "darwin"
 
+# Display scale factor, retrieved lazily on first use, since querying the
+# display can be slow.
+_scale: float | None = None
+_scale_lock = threading.Lock()
 
+
+def _retrieve_macos_scale_factor() -> float | None:
+    """
+    Retrieve the scale factor of the main display on macOS by querying
+    CoreGraphics directly.
+
+    Returns:
+        float | None: The ratio between the physical and logical width of the
+        main display's current mode, or None if it could not be determined.
+    """
+
+    try:
+        cg = ctypes.cdll.LoadLibrary(
+            "/System/Library/Frameworks/CoreGraphics.framework/CoreGraphics"
+        )
+    except OSError:
+        return None
+
+    cg.CGMainDisplayID.argtypes = []
+    cg.CGMainDisplayID.restype = ctypes.c_uint32
+    cg.CGDisplayCopyDisplayMode.argtypes = [ctypes.c_uint32]
+    cg.CGDisplayCopyDisplayMode.restype = ctypes.c_void_p
+    cg.CGDisplayModeGetWidth.argtypes = [ctypes.c_void_p]
+    cg.CGDisplayModeGetWidth.restype = ctypes.c_size_t
+    cg.CGDisplayModeGetPixelWidth.argtypes = [ctypes.c_void_p]
+    cg.CGDisplayModeGetPixelWidth.restype = ctypes.c_size_t
+    cg.CGDisplayModeRelease.argtypes = [ctypes.c_void_p]
+    cg.CGDisplayModeRelease.restype = None
+
+    mode = cg.CGDisplayCopyDisplayMode(cg.CGMainDisplayID())
+    if not mode:
+        return None
+
+    try:
+        width = cg.CGDisplayModeGetWidth(mode)
+        pixel_width = cg.CGDisplayModeGetPixelWidth(mode)
+    finally:
+        cg.CGDisplayModeRelease(mode)
+
+    if not width or not pixel_width:
+        return None
+
+    return pixel_width / width
+
+
+@functools.cache
 def _retrieve_scale_factor() -> float:
     """
     Retrieve the display scale factor based on the operating system.
-    """
 
-    system = platform.system()
+    The result is cached, since the scale factor is fixed for the lifetime of
+    the process.
+    """
 
     # MacOS
-    if system == "Darwin":
+    if _IS_DARWIN:
+        scale = _retrieve_macos_scale_factor()
+        if scale is not None:
+            return scale
+
+        # Fall back to parsing the display report if CoreGraphics could not be
+        # queried
         try:
             result = subprocess.run(
                 ["system_profiler", "SPDisplaysDataType"],
@@ -35,7 +95,19 @@ def _retrieve_scale_factor() -> float:
     return 1.0
 
 
-_SCALE = _retrieve_scale_factor()
+def _get_scale() -> float:
+    """
+    Return the display scale factor, retrieving it on first use.
+    """
+
+    global _scale
+
+    if _scale is None:
+        with _scale_lock:
+            if _scale is None:
+                _scale = _retrieve_scale_factor()
+
+    return _scale
 
 
 def get_scale_factor() -> float:
@@ -46,7 +118,7 @@ def get_scale_factor() -> float:
         float: The display scale factor.
     """
 
-    return _SCALE
+    return _get_scale()
 
 
 def get_screen_size() -> Size:
@@ -74,14 +146,17 @@ def scale_point(x: int, y: int, inverse: bool = False) -> Point:
         tuple[int, int]: The scaled (x, y) coordinates.
     """
 
+    scale = _get_scale()
+
     # Quick return if no scaling is needed
-    if _SCALE == 1.0:
+    if scale == 1.0:
         return x, y
 
+    # Divide rather than multiply by the reciprocal, which can truncate a
+    # pixel lower
     if inverse:
-        return int(x / _SCALE), int(y / _SCALE)
-    else:
-        return int(x * _SCALE), int(y * _SCALE)
+        return int(x / scale), int(y / scale)
+    return int(x * scale), int(y * scale)
 
 
 def scale_value(value: int, inverse: bool = False) -> int:
@@ -97,14 +172,15 @@ def scale_value(value: int, inverse: bool = False) -> int:
         int: The scaled value.
     """
 
+    scale = _get_scale()
+
     # Quick return if no scaling is needed
-    if _SCALE == 1.0:
+    if scale == 1.0:
         return value
 
     if inverse:
-        return int(value / _SCALE)
-    else:
-        return int(value * _SCALE)
+        return int(value / scale)
+    return int(value * scale)
 
 
 def scale_box(
@@ -125,10 +201,25 @@ def scale_box(
         tuple[int, int, int, int]: The scaled (left, top, width, height) of the box.
     """
 
-    scaled_left, scaled_top = scale_point(left, top, inverse=inverse)
-    scaled_width, scaled_height = scale_point(width, height, inverse=inverse)
+    scale = _get_scale()
+
+    # Quick return if no scaling is needed
+    if scale == 1.0:
+        return left, top, width, height
 
-    return scaled_left, scaled_top, scaled_width, scaled_height
+    if inverse:
+        return (
+            int(left / scale),
+            int(top / scale),
+            int(width / scale),
+            int(height / scale),
+        )
+    return (
+        int(left * scale),
+        int(top * scale),
+        int(width * scale),
+        int(height * scale),
+    )
 
 
 def center(left: int, top: int, width: int, height: int) -> Point:
@@ -4,7 +4,7 @@ from PIL import Image
 
 # PyAutoGUI uses physical coordinates for pixel operations, so we need to
 # rescale coordinates accordingly.
-from automacro.screen.coordinates import center, scale_box
+from automacro.screen.coordinates import center, get_scale_factor, scale_box
 from automacro.screen.types import BBox, Point
 
 try:
@@ -41,6 +41,39 @@ def _validate_image_file(image_path: str):
         raise ValueError(f"Invalid image file: '{image_path}'") from e
 
 
+def _filter_duplicates(instances: list[BBox], threshold: float) -> list[BBox]:
+    """
+    Filter out instances that are within the threshold distance of an
+    earlier instance. The first instance in each cluster is kept.
+
+    Args:
+        instances (list[tuple[int, int, int, int]]): The instances to filter.
+        threshold (float): The minimum distance between the top-left
+        corners of two instances to consider them separate.
+
+    Returns:
+        list[tuple[int, int, int, int]]: The filtered instances, in their
+        original order.
+    """
+
+    # Small optimization to avoid computing square roots
+    distance_sq = threshold * threshold
+
+    uniques = []
+
+    for i in instances:
+        ix, iy = i[0], i[1]
+        for u in uniques:
+            dx = ix - u[0]
+            dy = iy - u[1]
+            if dx * dx + dy * dy <= distance_sq:
+                break
+        else:
+            uniques.append(i)
+
+    return uniques
+
+
 def locate_image(
     image: str | Image.Image,
     *,
@@ -170,25 +203,19 @@ def locate_image_all(
             limit=limit,
             region=region,
         )
-        # Rescale instances to logical coordinates
-        instances = [scale_box(*instance, inverse=True) for instance in instances]
-
-        uniques = []
+        # Filter out instances that are within the threshold distance of each
+        # other. This is done in physical coordinates, so that only the kept
+        # instances need to be rescaled
+        scale = get_scale_factor()
+        uniques = _filter_duplicates(list(instances), threshold * scale)
 
-        # Small optimization to avoid computing square roots
-        distance_sq = pow(threshold, 2)
+        # scale_box is the identity without display scaling, so skip the
+        # per-instance calls entirely
+        if scale == 1.0:
+            return uniques
 
-        # Filter out instances that are within the threshold distance of each other
-        for i in instances:
-            if all(
-                map(
-                    lambda u: pow(i[0] - u[0], 2) + pow(i[1] - u[1], 2) > distance_sq,
-                    uniques,
-                )
-            ):
-                uniques.append(i)
-
-        return uniques
+        # Rescale instances to logical coordinates
+        return [scale_box(*instance, inverse=True) for instance in uniques]
     except pyscreeze.ImageNotFoundException:
         return []
 
@@ -1,10 +1,19 @@
-from .api import contains_text, matches_text, read_text, set_backend
+from .api import (
+    StreamingOCR,
+    contains_text,
+    matches_text,
+    read_text,
+    read_texts,
+    set_backend,
+)
 from .base import OCRBackend
 
 __all__ = [
     "contains_text",
     "matches_text",
     "read_text",
+    "read_texts",
     "set_backend",
     "OCRBackend",
+    "StreamingOCR",
 ]
@@ -1,8 +1,19 @@
-from automacro.screen.capture import capture
+import queue
+import threading
+from typing import Callable
+
+from automacro.screen.capture import _close_sct, capture
 from automacro.screen.ocr.base import OCRBackend
+from automacro.utils import _get_logger
 
 _backend: OCRBackend | None = None
 
+# Bound methods of the backend, cached by set_backend so that polling calls
+# skip the attribute lookups on the backend
+_read_text: Callable[..., str] | None = None
+_contains_text: Callable[..., bool] | None = None
+_matches_text: Callable[..., bool] | None = None
+
 
 def set_backend(backend: OCRBackend):
     """
@@ -18,8 +29,11 @@ def set_backend(backend: OCRBackend):
         backend (OCRBackend): An instance of the OCR backend to set.
     """
 
-    global _backend
+    global _backend, _read_text, _contains_text, _matches_text
     _backend = backend
+    _read_text = backend._read_text_cached
+    _contains_text = backend.contains_text
+    _matches_text = backend.matches_text
 
 
 def read_text(region: tuple[int, int, int, int] | None = None) -> str:
@@ -35,13 +49,38 @@ def read_text(region: tuple[int, int, int, int] | None = None) -> str:
         str: The extracted text from the captured image.
     """
 
-    if _backend is None:
+    read = _read_text
+    if read is None:
         raise RuntimeError(
             "OCR backend is not set. Please set it using set_backend() or use()"
         )
 
     image = capture(region=region)
-    return _backend.read_text(image)
+    return read(image)
+
+
+def read_texts(regions: list[tuple[int, int, int, int] | None]) -> list[str]:
+    """
+    Capture a screenshot of each of the specified regions and extract their
+    text using OCR. The backend may recognize the regions concurrently, which
+    is faster than calling read_text() for each region.
+
+    Args:
+        regions (list[tuple[int, int, int, int] | None]): The regions (left,
+        top, width, height) to capture. A region of None captures the entire
+        screen.
+
+    Returns:
+        list[str]: The extracted text of each region, in the same order.
+    """
+
+    if _backend is None:
+        raise RuntimeError(
+            "OCR backend is not set. Please set it using set_backend() or use()"
+        )
+
+    images = [capture(region=region) for region in regions]
+    return _backend._read_texts_cached(images)
 
 
 def contains_text(
@@ -68,15 +107,14 @@ def contains_text(
         bool: True if the text is found, False otherwise.
     """
 
-    if _backend is None:
+    contains = _contains_text
+    if contains is None:
         raise RuntimeError(
             "OCR backend is not set. Please set it using set_backend() or use()"
         )
 
     image = capture(region=region)
-    return _backend.contains_text(
-        image, text, exact=exact, case_sensitive=case_sensitive
-    )
+    return contains(image, text, exact=exact, case_sensitive=case_sensitive)
 
 
 def matches_text(
@@ -99,10 +137,186 @@ def matches_text(
         bool: True if the pattern matches, False otherwise.
     """
 
-    if _backend is None:
+    matches = _matches_text
+    if matches is None:
         raise RuntimeError(
             "OCR backend is not set. Please set it using set_backend() or use()"
         )
 
     image = capture(region=region)
-    return _backend.matches_text(image, pattern)
+    return matches(image, pattern)
+
+
+class StreamingOCR:
+    """
+    Continuously extracts the text of a screen region in the background.
+
+    Capturing and OCR run on separate threads. The capture thread keeps
+    replacing a single pending frame, so whenever the OCR thread finishes a
+    frame, it picks up the most recent capture rather than a backlog. This is
+    useful for loops that need the current text of a region on every
+    iteration, which can then call latest() instead of read_text().
+    """
+
+    def __init__(
+        self,
+        region: tuple[int, int, int, int] | None = None,
+        *,
+        backend: OCRBackend | None = None,
+        interval: float = 0.05,
+    ):
+        """
+        Initialize the streaming OCR reader. Call start() to begin reading.
+
+        Args:
+            region (tuple[int, int, int, int] | None): A region (left, top,
+            width, height) to capture. If None, captures the entire screen.
+            Default is None.
+            backend (OCRBackend | None): The OCR backend to use. If None, the
+            backend set with set_backend() when start() is called is used.
+            Default is None.
+            interval (float): Time (in seconds) to wait between two captures.
+            Default is 0.05.
+        """
+
+        self._region = region
+        self._backend = backend
+        self._interval = interval
+
+        # Holds at most the latest captured frame not yet read
+        self._frames: queue.Queue = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+        self._latest: str | None = None
+        self._has_text = threading.Event()
+
+        self._logger = _get_logger(self.__class__)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def _capture_loop(self):
+        """
+        Capture thread loop. Each frame replaces the pending one if the OCR
+        thread has not picked it up yet.
+        """
+
+        try:
+            self._capture_frames()
+        finally:
+            # Release the display handle this thread opened for capturing
+            _close_sct()
+
+    def _capture_frames(self):
+        """
+        Capture frames until the reader is stopped.
+        """
+
+        frames = self._frames
+        stop_event = self._stop_event
+
+        while not stop_event.is_set():
+            try:
+                image = capture(region=self._region)
+            except Exception as e:
+                self._logger.error(f"Error capturing screen: {e}")
+                stop_event.wait(0.1)
+                continue
+
+            # Drop the stale frame, if any. The OCR thread only ever takes
+            # frames out, so the slot is free for the new one afterwards
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+            frames.put_nowait(image)
+
+            stop_event.wait(self._interval)
+
+    def _ocr_loop(self, backend: OCRBackend):
+        """
+        OCR thread loop. Extracts the text of each captured frame.
+
+        Args:
+            backend (OCRBackend): The OCR backend to use.
+        """
+
+        frames = self._frames
+        stop_event = self._stop_event
+
+        while not stop_event.is_set():
+            try:
+                image = frames.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            try:
+                text = backend._read_text_cached(image)
+            except Exception as e:
+                self._logger.error(f"Error extracting text: {e}")
+                continue
+
+            self._latest = text
+            self._has_text.set()
+
+    def start(self):
+        """
+        Start capturing and reading the region in the background.
+        """
+
+        if self._threads:
+            return
+
+        backend = self._backend or _backend
+        if backend is None:
+            raise RuntimeError(
+                "OCR backend is not set. Please set it using set_backend() or use()"
+            )
+
+        # Drop the frame and text left over from a previous run
+        self._frames = queue.Queue(maxsize=1)
+        self._latest = None
+        self._has_text.clear()
+        self._stop_event.clear()
+
+        self._threads = [
+            threading.Thread(target=self._capture_loop, daemon=True),
+            threading.Thread(target=self._ocr_loop, args=(backend,), daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """
+        Stop reading the region and wait for the background threads to exit.
+        An OCR call in progress is allowed to complete first.
+        """
+
+        self._stop_event.set()
+
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def latest(self, timeout: float = 0.0) -> str | None:
+        """
+        Return the most recently extracted text of the region.
+
+        Args:
+            timeout (float): Maximum time (in seconds) to wait for the first
+            text to be extracted, if none has been yet. Default is 0.0.
+
+        Returns:
+            str | None: The most recently extracted text, or None if no text
+            has been extracted yet.
+        """
+
+        if timeout > 0.0:
+            self._has_text.wait(timeout)
+
+        return self._latest
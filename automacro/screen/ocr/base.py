@@ -1,8 +1,52 @@
+import functools
+import hashlib
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 from PIL import Image
 
+# Characters with a special meaning in regex patterns. Patterns without any of
+# them match literally, so they can be searched for as plain substrings
+_REGEX_META = frozenset(r".^$*+?{}[]\|()")
+
+# Maximum number of images whose extracted text is remembered per backend
+_TEXT_CACHE_SIZE = 64
+_text_cache_lock = threading.Lock()
+
+
+def _image_key(image: Image.Image) -> tuple:
+    """
+    Build the OCR cache key of an image from its mode, size and a digest of its
+    pixels.
+
+    Args:
+        image (PIL.Image.Image): The image.
+
+    Returns:
+        tuple: The cache key of the image.
+    """
+
+    digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+    return image.mode, image.size, digest
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    """
+    Compile a regex pattern, caching the result so that polling with the same
+    pattern skips the lookup in the re module's own cache.
+
+    Args:
+        pattern (str): The regex pattern to compile.
+
+    Returns:
+        re.Pattern: The compiled pattern.
+    """
+
+    return re.compile(pattern)
+
 
 class OCRBackend(ABC):
     """
@@ -20,6 +64,113 @@ class OCRBackend(ABC):
 
         ...
 
+    def _get_cached_text(self, key: tuple) -> str | None:
+        """
+        Look up the text extracted from a recently read image.
+
+        Args:
+            key (tuple): The cache key of the image (see _image_key).
+
+        Returns:
+            str | None: The cached text, or None if the image is not cached.
+        """
+
+        with _text_cache_lock:
+            cache = getattr(self, "_text_cache", None)
+            if cache is None:
+                cache = self._text_cache = OrderedDict()
+
+            text = cache.get(key)
+            if text is not None:
+                cache.move_to_end(key)
+            return text
+
+    def _cache_text(self, key: tuple, text: str):
+        """
+        Remember the text extracted from an image, evicting the least recently
+        used entry if the cache is full.
+
+        Args:
+            key (tuple): The cache key of the image (see _image_key).
+            text (str): The extracted text.
+        """
+
+        with _text_cache_lock:
+            cache = self._text_cache
+            cache[key] = text
+            if len(cache) > _TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _read_text_cached(self, image: Image.Image) -> str:
+        """
+        Extract text from the given image, reusing the text extracted from an
+        identical image if one was recently read. Polling the same region of
+        the screen often captures the same pixels, and hashing them is far
+        cheaper than running OCR again.
+
+        Args:
+            image (PIL.Image.Image): The image to perform OCR on.
+
+        Returns:
+            str: The extracted text.
+        """
+
+        key = _image_key(image)
+
+        text = self._get_cached_text(key)
+        if text is None:
+            text = self.read_text(image)
+            self._cache_text(key, text)
+
+        return text
+
+    def _read_texts_cached(self, images: list[Image.Image]) -> list[str]:
+        """
+        Extract text from each of the given images, like _read_text_cached.
+        Only the distinct images that are not cached are passed to read_texts.
+
+        Args:
+            images (list[PIL.Image.Image]): The images to perform OCR on.
+
+        Returns:
+            list[str]: The extracted text of each image, in the same order.
+        """
+
+        keys = [_image_key(image) for image in images]
+        texts = [self._get_cached_text(key) for key in keys]
+
+        # Images missing from the cache, keyed so that an image appearing
+        # more than once in the batch is only read once
+        misses: dict[tuple, Image.Image] = {}
+        for key, image, text in zip(keys, images, texts):
+            if text is None and key not in misses:
+                misses[key] = image
+
+        if not misses:
+            return texts
+
+        read = dict(zip(misses, self.read_texts(list(misses.values()))))
+        for key, text in read.items():
+            self._cache_text(key, text)
+
+        return [read[key] if text is None else text for key, text in zip(keys, texts)]
+
+    def read_texts(self, images: list[Image.Image]) -> list[str]:
+        """
+        Extract text from each of the given images using OCR.
+
+        Backends that can recognize several images concurrently should
+        override this. By default, the images are read one after another.
+
+        Args:
+            images (list[PIL.Image.Image]): The images to perform OCR on.
+
+        Returns:
+            list[str]: The extracted text of each image, in the same order.
+        """
+
+        return [self.read_text(image) for image in images]
+
     def contains_text(
         self,
         image: Image.Image,
@@ -41,7 +192,7 @@ class OCRBackend(ABC):
             case-sensitive. Default is False.
         """
 
-        extracted_text = self.read_text(image)
+        extracted_text = self._read_text_cached(image)
 
         if not case_sensitive:
             text = text.lower()
@@ -62,5 +213,9 @@ class OCRBackend(ABC):
             pattern (str): The regex pattern to search for.
         """
 
-        extracted_text = self.read_text(image)
-        return re.search(pattern, extracted_text) is not None
+        extracted_text = self._read_text_cached(image)
+
+        if _REGEX_META.isdisjoint(pattern):
+            return pattern in extracted_text
+
+        return _compile(pattern).search(extracted_text) is not None
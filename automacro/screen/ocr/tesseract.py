@@ -1,14 +1,33 @@
+import os
+import threading
+
 from PIL import Image
 
+from automacro.core import ThreadPool
 from automacro.screen.ocr.base import OCRBackend
 
+# Tesseract's OpenMP multithreading is slower than running single-threaded for
+# the small images we recognize, and it competes with running several
+# recognitions in parallel. This has to be set before tesserocr loads the
+# Tesseract library; tesseract subprocesses started by pytesseract inherit it.
+# An explicit setting by the user is left untouched
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# Prefer tesserocr, which keeps the Tesseract engine loaded in-process, over
+# pytesseract, which runs a new tesseract subprocess for every image
 try:
-    import pytesseract
-except ImportError as e:
-    raise RuntimeError(
-        "pytesseract is required for TesseractOCR backend. "
-        "Install with: pip install automacro[ocr-tesseract]"
-    ) from e
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+    try:
+        import pytesseract
+    except ImportError as e:
+        raise RuntimeError(
+            "tesserocr or pytesseract is required for TesseractOCR backend. "
+            "Install with: pip install automacro[ocr-tesseract] "
+            "or pip install automacro[ocr-tesserocr]"
+        ) from e
 
 
 class TesseractOCR(OCRBackend):
@@ -16,5 +35,88 @@ class TesseractOCR(OCRBackend):
     A Tesseract OCR backend implementation.
     """
 
+    def __init__(self, lang: str = "eng"):
+        """
+        Initialize the Tesseract OCR backend.
+
+        If tesserocr is installed, a single Tesseract engine is loaded here and
+        reused for every image, which avoids starting a tesseract process and
+        reloading the language model on each call. Otherwise, pytesseract is
+        used. Call close() to release the engine when it is no longer needed.
+
+        Importing this module limits Tesseract to a single OpenMP thread by
+        setting OMP_THREAD_LIMIT=1, unless the variable is already set.
+
+        Args:
+            lang (str): The Tesseract language(s) to recognize, e.g. "eng" or
+            "eng+fra". Default is "eng".
+        """
+
+        self._lang = lang
+
+        self._api = None
+        # The engine holds per-image state, so it cannot be shared by
+        # concurrent calls
+        self._api_lock = threading.Lock()
+
+        if tesserocr is not None:
+            self._api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
     def read_text(self, image: Image.Image) -> str:
-        return pytesseract.image_to_string(image)
+        # Tesseract works on grayscale internally, so convert it once here.
+        # This also cuts the data handed to Tesseract to a byte per pixel
+        if image.mode != "L":
+            image = image.convert("L")
+
+        if tesserocr is None:
+            return pytesseract.image_to_string(image, lang=self._lang)
+
+        with self._api_lock:
+            api = self._api
+            if api is None:
+                # The engine was released by close(), so load it again
+                api = self._api = tesserocr.PyTessBaseAPI(lang=self._lang)
+
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+    def read_texts(self, images: list[Image.Image]) -> list[str]:
+        """
+        Extract text from each of the given images using OCR.
+
+        With pytesseract, a tesseract process is run for each image, and up to
+        one process per CPU core runs at a time. A tesserocr engine can only
+        read one image at a time, so the images are read one after another.
+
+        Args:
+            images (list[PIL.Image.Image]): The images to perform OCR on.
+
+        Returns:
+            list[str]: The extracted text of each image, in the same order.
+        """
+
+        if tesserocr is not None or len(images) < 2:
+            return super().read_texts(images)
+
+        max_workers = min(len(images), os.cpu_count() or 1)
+        with ThreadPool(max_workers=max_workers) as pool:
+            futures = [pool.submit(self.read_text, image) for image in images]
+            return [future.result() for future in futures]
+
+    def close(self):
+        """
+        Release the Tesseract engine, if one was loaded. If the backend is used
+        to read text again afterwards, the engine is loaded again.
+        """
+
+        with self._api_lock:
+            api = self._api
+            if api is not None:
+                self._api = None
+                api.End()
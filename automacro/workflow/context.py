@@ -18,6 +18,9 @@ class ExecutionContext:
 
         self._interrupt_event = threading.Event()
 
+        # Bound once, since check_interrupt may be polled in tight loops
+        self._is_interrupted = self._interrupt_event.is_set
+
     def _pause(self) -> None:
         """
         Internal method to pause the workflow execution.
@@ -43,7 +46,7 @@ class ExecutionContext:
             InterruptException: If the workflow has been interrupted.
         """
 
-        if self._interrupt_event.is_set():
+        if self._is_interrupted():
             raise InterruptException()
 
     def wait(self, duration: float) -> None:
@@ -34,7 +34,7 @@ class _StepKind(Enum):
     OUT = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class _StepRequest:
     """
     A request to perform a stepping action in the workflow.
@@ -47,7 +47,7 @@ class _StepRequest:
     done: threading.Event | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class _Frame:
     """
     A frame on the workflow's execution stack, representing a single node that
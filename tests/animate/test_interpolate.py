@@ -0,0 +1,23 @@
+import pytest
+
+from automacro.animate import easing, interpolate, interpolate_batch
+
+
+def test_interpolate_batch_matches_interpolate() -> None:
+    ts = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    for easing_fn in (easing.linear, easing.ease_in_out_quad):
+        expected = [interpolate(10.0, 30.0, t, 1.0, easing_fn) for t in ts]
+        actual = interpolate_batch(10.0, 30.0, ts, 1.0, easing_fn)
+        assert actual == pytest.approx(expected)
+
+
+def test_interpolate_batch_clamps_time_to_duration() -> None:
+    # Times outside [0, duration] stay at the start and end values
+    values = interpolate_batch(0.0, 100.0, [-1.0, 0.5, 3.0], 2.0, easing.linear)
+    assert values == pytest.approx([0.0, 25.0, 100.0])
+
+
+def test_interpolate_batch_with_no_duration_returns_end() -> None:
+    assert interpolate_batch(0.0, 5.0, [0.0, 1.0], 0.0, easing.linear) == [5.0, 5.0]
+    assert interpolate_batch(0.0, 5.0, [], 0.0, easing.linear) == []
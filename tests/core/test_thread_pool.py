@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from automacro import ThreadPool
+
+
+def _shard_sizes(pool: ThreadPool) -> list[int]:
+    return [executor._max_workers for executor in pool._executors]
+
+
+def test_shards_split_workers_evenly() -> None:
+    with ThreadPool(max_workers=4, shards=3) as pool:
+        assert _shard_sizes(pool) == [2, 1, 1]
+
+    with ThreadPool(max_workers=10, shards=4) as pool:
+        assert _shard_sizes(pool) == [3, 3, 2, 2]
+
+
+def test_shards_are_capped_at_max_workers() -> None:
+    # Every shard needs a worker, so there are never more shards than workers
+    with ThreadPool(max_workers=2, shards=4) as pool:
+        assert _shard_sizes(pool) == [1, 1]
+
+
+def test_shards_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        ThreadPool(shards=0)
+
+
+def test_submit_distributes_tasks_across_shards() -> None:
+    threads = set()
+    lock = threading.Lock()
+    barrier = threading.Barrier(3)
+
+    def task(i: int) -> int:
+        # Hold every worker until all three run, so each task must have
+        # landed on a different shard
+        barrier.wait(timeout=1.0)
+        with lock:
+            threads.add(threading.current_thread())
+        return i * 2
+
+    with ThreadPool(max_workers=3, shards=3) as pool:
+        futures = [pool.submit(task, i) for i in range(3)]
+        assert [future.result(timeout=1.0) for future in futures] == [0, 2, 4]
+
+    assert len(threads) == 3
+
+
+def test_submit_after_shutdown_raises() -> None:
+    pool = ThreadPool(max_workers=2, shards=2)
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
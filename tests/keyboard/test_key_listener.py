@@ -0,0 +1,109 @@
+import pytest
+
+try:
+    from pynput.keyboard import Key as PynputKey
+    from pynput.keyboard import KeyCode
+
+    from automacro.keyboard import Key, KeyListener, KeySequence, ModifierKey
+    from automacro.keyboard.listener import _get_modifiers_mask
+except Exception:
+    # Importing pynput needs a display on some platforms
+    pytest.skip("pynput is not importable", allow_module_level=True)
+
+
+CTRL, CTRL_L, CTRL_R = ModifierKey.CTRL, ModifierKey.CTRL_L, ModifierKey.CTRL_R
+SHIFT, SHIFT_L, SHIFT_R = ModifierKey.SHIFT, ModifierKey.SHIFT_L, ModifierKey.SHIFT_R
+
+
+def _listener(callbacks: dict) -> KeyListener:
+    return KeyListener(callbacks, inline_callbacks=True)
+
+
+def _tap(listener: KeyListener, *keys) -> None:
+    """
+    Press the given keys in order, then release them in reverse order.
+    """
+
+    for key in keys:
+        listener._on_press(key)
+    for key in reversed(keys):
+        listener._on_release(key)
+
+
+def test_modifiers_mask() -> None:
+    assert _get_modifiers_mask([]) == 0
+    assert _get_modifiers_mask([CTRL_L]) == CTRL_L._bit
+    assert _get_modifiers_mask([CTRL_L, SHIFT_R]) == CTRL_L._bit | SHIFT_R._bit
+    # Every modifier has its own bit
+    assert len({mod._bit for mod in ModifierKey}) == len(ModifierKey)
+
+
+def test_general_modifier_registers_both_variants() -> None:
+    listener = _listener({KeySequence("a", {CTRL, SHIFT_L}, repeat=True): print})
+
+    assert set(listener._callbacks_exact_repeat) == {
+        (CTRL_L._bit | SHIFT_L._bit, "a"),
+        (CTRL_R._bit | SHIFT_L._bit, "a"),
+    }
+
+
+def test_duplicate_masks_register_once() -> None:
+    # CTRL already covers CTRL_L and CTRL_R, so listing them as well must not
+    # register the same combination more than once
+    listener = _listener({KeySequence("a", {CTRL, CTRL_L, CTRL_R}, repeat=True): print})
+
+    assert listener._callbacks_exact_repeat == {
+        (CTRL_L._bit | CTRL_R._bit, "a"): [print]
+    }
+
+
+def test_callbacks_fire_once_per_press() -> None:
+    calls = []
+
+    listener = _listener(
+        {
+            KeySequence("a", {CTRL, CTRL_L}): lambda: calls.append("C-a"),
+            KeySequence("a", {SHIFT, SHIFT_R}, repeat=True): lambda: calls.append(
+                "S-a"
+            ),
+            KeySequence("b", {CTRL}, ignore_modifiers=True): lambda: calls.append(
+                "C-b~"
+            ),
+        }
+    )
+
+    _tap(listener, PynputKey.ctrl_l, KeyCode.from_char("a"))
+    assert calls == ["C-a"]
+
+    _tap(listener, PynputKey.shift_r, KeyCode.from_char("A"))
+    assert calls == ["C-a", "S-a"]
+
+    # Subset matching fires with extra modifiers held too
+    _tap(listener, PynputKey.ctrl_r, PynputKey.shift_l, KeyCode.from_char("B"))
+    assert calls == ["C-a", "S-a", "C-b~"]
+
+
+def test_non_repeat_callback_waits_for_release() -> None:
+    calls = []
+    listener = _listener({KeySequence("a", {CTRL}): lambda: calls.append("C-a")})
+
+    listener._on_press(PynputKey.ctrl_l)
+    listener._on_press(KeyCode.from_char("a"))
+    # Holding the key down generates more presses, which are ignored
+    listener._on_press(KeyCode.from_char("a"))
+    assert calls == ["C-a"]
+
+    listener._on_release(KeyCode.from_char("a"))
+    listener._on_press(KeyCode.from_char("a"))
+    assert calls == ["C-a", "C-a"]
+
+
+def test_special_keys_and_unknown_keys() -> None:
+    calls = []
+    listener = _listener({KeySequence(Key.F1): lambda: calls.append("F1")})
+
+    _tap(listener, PynputKey.f1)
+    # Key events pynput cannot identify are ignored
+    _tap(listener, None)
+
+    assert calls == ["F1"]
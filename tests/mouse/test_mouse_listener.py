@@ -0,0 +1,195 @@
+import threading
+import time
+
+import pytest
+from conftest import wait_until
+
+try:
+    from pynput.mouse import Button
+
+    from automacro.mouse import MouseButton, MouseListener
+    from automacro.mouse.listener import _EventDispatcher
+except Exception:
+    # Importing pynput needs a display on some platforms
+    pytest.skip("pynput is not importable", allow_module_level=True)
+
+
+class SyncPool:
+    """
+    A thread pool stand-in that runs tasks right away on the calling thread.
+    """
+
+    def submit(self, fn, *args):
+        fn(*args)
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+
+def test_dispatcher_delivers_events_in_order() -> None:
+    events = []
+
+    def on_move(x: int, y: int) -> None:
+        events.append(("move", x, y))
+
+    def on_click(button: str) -> None:
+        events.append(("click", button))
+
+    dispatcher = _EventDispatcher(moves=on_move)
+    dispatcher.submit(on_move, 0, 0)
+    dispatcher.submit(on_click, "left")
+    dispatcher.submit(on_move, 1, 1)
+    dispatcher.shutdown()
+
+    assert events == [("move", 0, 0), ("click", "left"), ("move", 1, 1)]
+
+    # Nothing can be submitted after shutting down
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(on_move, 2, 2)
+
+
+def test_dispatcher_drops_only_moves_when_full() -> None:
+    events = []
+    release = threading.Event()
+
+    def on_move(x: int, y: int) -> None:
+        events.append(("move", x))
+
+    def on_click(button: str) -> None:
+        events.append(("click", button))
+
+    def block() -> None:
+        release.wait()
+
+    dispatcher = _EventDispatcher(max_pending=3, moves=on_move)
+    # Hold the worker up so that the events below pile up in the buffer
+    dispatcher.submit(block)
+    wait_until(lambda: not dispatcher._events)
+
+    for x in range(4):
+        dispatcher.submit(on_move, x, 0)
+    # Clicks are queued even though the buffer is full, after the latest
+    # position dropped before them
+    dispatcher.submit(on_click, "left")
+    dispatcher.submit(on_click, "right")
+    for x in range(4, 7):
+        dispatcher.submit(on_move, x, 0)
+
+    release.set()
+    dispatcher.shutdown()
+
+    assert events == [
+        ("move", 0),
+        ("move", 1),
+        ("move", 2),
+        ("move", 3),
+        ("click", "left"),
+        ("click", "right"),
+        # The latest dropped position is delivered once the buffer drains
+        ("move", 6),
+    ]
+
+
+def test_dispatcher_coalesces_queued_moves() -> None:
+    events = []
+    release = threading.Event()
+
+    def on_move(x: int, y: int) -> None:
+        events.append(("move", x))
+
+    def on_click(button: str) -> None:
+        events.append(("click", button))
+
+    dispatcher = _EventDispatcher(moves=on_move, coalesce_moves=True)
+    dispatcher.submit(release.wait)
+    wait_until(lambda: not dispatcher._events)
+
+    for x in range(3):
+        dispatcher.submit(on_move, x, 0)
+    dispatcher.submit(on_click, "left")
+    for x in range(3, 6):
+        dispatcher.submit(on_move, x, 0)
+
+    release.set()
+    dispatcher.shutdown()
+
+    # Each run of moves collapses into its last position, and the click stays
+    # between them
+    assert events == [("move", 2), ("click", "left"), ("move", 5)]
+
+
+def test_listener_coalesces_moves_with_shared_thread_pool() -> None:
+    moves = []
+    tasks = []
+
+    class DeferredPool(SyncPool):
+        def submit(self, fn, *args):
+            tasks.append((fn, args))
+
+    listener = MouseListener(
+        on_move=lambda x, y: moves.append((x, y)),
+        thread_pool=DeferredPool(),
+        coalesce_moves=True,
+    )
+
+    for x in range(5):
+        listener._on_move(x, 0)
+    # A single delivery task is scheduled for the whole burst
+    assert len(tasks) == 1
+
+    fn, args = tasks.pop()
+    fn(*args)
+    assert moves == [(4, 0)]
+
+
+def test_listener_delivers_clicks_and_scrolls() -> None:
+    events = []
+
+    listener = MouseListener(
+        on_click=lambda x, y, button, pressed: events.append((button, pressed)),
+        on_scroll=lambda x, y, dx, dy: events.append((dx, dy)),
+        thread_pool=SyncPool(),
+    )
+
+    listener._on_click(0, 0, Button.left, True)
+    listener._on_scroll(0, 0, 0, -1)
+
+    assert events == [(MouseButton.LEFT, True), (0, -1)]
+
+
+def test_listener_throttles_moves() -> None:
+    moves = []
+
+    listener = MouseListener(
+        on_move=lambda x, y: moves.append((x, y)),
+        thread_pool=SyncPool(),
+        move_interval=0.05,
+    )
+
+    for x in range(5):
+        listener._on_move(x, 0)
+    # Only the first move gets through right away
+    assert moves == [(0, 0)]
+
+    # The last throttled move is delivered once the interval has passed
+    wait_until(lambda: moves == [(0, 0), (4, 0)])
+    time.sleep(0.1)
+    assert moves == [(0, 0), (4, 0)]
+
+
+def test_listener_stop_flushes_throttled_move() -> None:
+    moves = []
+
+    listener = MouseListener(
+        on_move=lambda x, y: moves.append((x, y)),
+        thread_pool=SyncPool(),
+        move_interval=10.0,
+    )
+
+    listener._on_move(0, 0)
+    listener._on_move(1, 0)
+    assert moves == [(0, 0)]
+
+    # Stopping delivers the throttled move without waiting for its timer
+    listener.stop()
+    assert moves == [(0, 0), (1, 0)]
@@ -0,0 +1,40 @@
+import pytest
+
+try:
+    from automacro.screen import hex_to_rgb, rgb_to_hex
+except Exception:
+    # Importing automacro.screen needs its capture dependencies and a display
+    pytest.skip("automacro.screen is not importable", allow_module_level=True)
+
+
+def test_rgb_to_hex() -> None:
+    assert rgb_to_hex((0, 0, 0)) == "#000000"
+    assert rgb_to_hex((255, 128, 1)) == "#FF8001"
+    assert rgb_to_hex((18, 52, 171)) == "#1234AB"
+
+
+def test_rgb_to_hex_rejects_out_of_range_values() -> None:
+    with pytest.raises(ValueError):
+        rgb_to_hex((256, 0, 0))
+    with pytest.raises(ValueError):
+        rgb_to_hex((0, -1, 0))
+
+
+def test_hex_to_rgb() -> None:
+    assert hex_to_rgb("#000000") == (0, 0, 0)
+    assert hex_to_rgb("#FF8001") == (255, 128, 1)
+    # Lowercase digits are accepted too
+    assert hex_to_rgb("#1234ab") == (18, 52, 171)
+
+
+def test_hex_to_rgb_round_trips() -> None:
+    for rgb in [(0, 0, 0), (255, 255, 255), (1, 2, 3), (200, 100, 50)]:
+        assert hex_to_rgb(rgb_to_hex(rgb)) == rgb
+
+
+@pytest.mark.parametrize(
+    "hex_color", ["FF8001", "#FF800", "#FF80011", "#GG8001", "#FF 801", ""]
+)
+def test_hex_to_rgb_rejects_invalid_strings(hex_color: str) -> None:
+    with pytest.raises(ValueError):
+        hex_to_rgb(hex_color)
@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+from conftest import wait_until
+from PIL import Image
+
+try:
+    import automacro.screen.ocr.api as api
+    import automacro.screen.ocr.base as base
+    from automacro.screen.ocr import OCRBackend, StreamingOCR
+except Exception:
+    # Importing automacro.screen needs its capture dependencies and a display
+    pytest.skip("automacro.screen is not importable", allow_module_level=True)
+
+
+class FakeOCR(OCRBackend):
+    """
+    Reads the text stored in an image's info, and records every image it reads.
+    """
+
+    def __init__(self):
+        self.reads: list[Image.Image] = []
+        self.batches: list[int] = []
+
+    def read_text(self, image: Image.Image) -> str:
+        self.reads.append(image)
+        return TEXTS[image.getpixel((0, 0))]
+
+    def read_texts(self, images: list[Image.Image]) -> list[str]:
+        self.batches.append(len(images))
+        return super().read_texts(images)
+
+
+# The text "shown" by an image, keyed by the gray level of its pixels
+TEXTS = {i: f"Text {i}: Hello, World." for i in range(256)}
+
+
+def _image(level: int) -> Image.Image:
+    return Image.new("L", (4, 4), level)
+
+
+def test_matches_text_literal_and_regex_patterns() -> None:
+    ocr = FakeOCR()
+    image = _image(1)
+
+    # Patterns without regex metacharacters are matched as plain substrings
+    assert ocr.matches_text(image, "Hello")
+    assert not ocr.matches_text(image, "hello")
+    assert ocr.matches_text(image, "Text 1: Hello, World")
+
+    assert ocr.matches_text(image, r"Text \d+:")
+    assert ocr.matches_text(image, "World.$")
+    assert not ocr.matches_text(image, "^Hello")
+    # An escaped metacharacter still goes through the regex engine
+    assert ocr.matches_text(image, r"World\.")
+    assert not ocr.matches_text(image, r"Hello\.")
+
+
+def test_contains_text() -> None:
+    ocr = FakeOCR()
+    image = _image(2)
+
+    assert ocr.contains_text(image, "hello")
+    assert not ocr.contains_text(image, "hello", case_sensitive=True)
+    assert ocr.contains_text(image, "text 2: hello, world.", exact=True)
+    assert not ocr.contains_text(image, "Hello", exact=True)
+
+
+def test_identical_images_are_read_once() -> None:
+    ocr = FakeOCR()
+
+    assert ocr.contains_text(_image(3), "Hello")
+    # A different image object with the same pixels hits the cache
+    assert ocr.matches_text(_image(3), "World")
+    assert len(ocr.reads) == 1
+
+    # Different pixels are read again
+    assert ocr.contains_text(_image(4), "Text 4")
+    assert len(ocr.reads) == 2
+
+
+def test_text_cache_evicts_least_recently_used() -> None:
+    ocr = FakeOCR()
+    size = base._TEXT_CACHE_SIZE
+
+    for level in range(size):
+        ocr._read_text_cached(_image(level))
+    # Use the first image again, so the second one is the oldest
+    ocr._read_text_cached(_image(0))
+    assert len(ocr.reads) == size
+
+    # Reading one more image evicts the second one, but not the first
+    ocr._read_text_cached(_image(size))
+    ocr._read_text_cached(_image(0))
+    assert len(ocr.reads) == size + 1
+
+    ocr._read_text_cached(_image(1))
+    assert len(ocr.reads) == size + 2
+
+
+def test_read_texts_cached_reads_each_distinct_image_once() -> None:
+    ocr = FakeOCR()
+    ocr._read_text_cached(_image(5))
+
+    images = [_image(5), _image(6), _image(7), _image(6)]
+    assert ocr._read_texts_cached(images) == [TEXTS[i] for i in (5, 6, 7, 6)]
+    # The cached image is skipped and the repeated one is read once
+    assert ocr.batches == [2]
+
+    # Everything is cached now, so no batch is read at all
+    assert ocr._read_texts_cached(images[::-1]) == [TEXTS[i] for i in (6, 7, 6, 5)]
+    assert ocr.batches == [2]
+
+
+def test_streaming_ocr_reads_latest_capture(monkeypatch) -> None:
+    level = 10
+    closed = threading.Event()
+
+    def capture(region=None):
+        return _image(level)
+
+    monkeypatch.setattr(api, "capture", capture)
+    monkeypatch.setattr(api, "_close_sct", closed.set)
+
+    ocr = FakeOCR()
+    stream = StreamingOCR(backend=ocr, interval=0.01)
+    # Nothing has been read before starting
+    assert stream.latest() is None
+
+    with stream:
+        assert stream.latest(timeout=1.0) == TEXTS[10]
+
+        level = 11
+        wait_until(lambda: stream.latest() == TEXTS[11])
+
+    # The capture thread releases its capture handle when it exits
+    assert closed.is_set()
+
+    # The same frame is captured over and over, but only read once per level
+    assert [image.getpixel((0, 0)) for image in ocr.reads] == [10, 11]
+
+
+def test_streaming_ocr_requires_backend(monkeypatch) -> None:
+    monkeypatch.setattr(api, "_backend", None)
+
+    with pytest.raises(RuntimeError):
+        StreamingOCR().start()